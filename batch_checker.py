@@ -0,0 +1,100 @@
+## GroupID-20 (22114029_22113078) - Dhruv, Komal
+## Date: Nov 4, 2025
+## batch_checker.py - Bulk multi-polygon validation over a process pool
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Sequence
+
+from geometry import Point, orient
+from polygon_checker import check_rings
+import segment_io
+
+Ring = List[Point]
+
+class PolygonVerdict(NamedTuple):
+    index: int              # position in the input
+    simple: bool
+    points: List[Point]     # self-intersection points (empty when simple)
+    method: str             # "trivial" (O(n) pre-pass) or "sweep"
+
+def as_rings(polygon: Sequence) -> List[Ring]:
+    """A polygon is either one ring of points or a list of rings."""
+    if polygon and isinstance(polygon[0][0], (int, float)):
+        return [list(polygon)]
+    return [list(r) for r in polygon]
+
+def is_trivially_simple(ring: Ring) -> bool:
+    """
+    O(n) pre-pass: True for triangles and strictly convex rings. A ring
+    whose turns all have the same sign and whose edge x-direction changes
+    sign only twice winds exactly once, so it cannot self-intersect.
+    Anything else (including collinear runs) is left to the sweep.
+    """
+    n = len(ring)
+    if n == 3:
+        return True     # every pair of edges is adjacent
+    if n < 3:
+        return False
+    turn_sign = 0
+    dx_signs = []
+    for i in range(n):
+        a, b, c = ring[i], ring[(i + 1) % n], ring[(i + 2) % n]
+        o = orient(a, b, c)
+        if o == 0:
+            return False
+        s = 1 if o > 0 else -1
+        if turn_sign == 0:
+            turn_sign = s
+        elif s != turn_sign:
+            return False
+        if b[0] != a[0]:
+            dx_signs.append(b[0] > a[0])
+    flips = sum(dx_signs[i] != dx_signs[i - 1] for i in range(len(dx_signs)))
+    return flips <= 2
+
+def check_one(index: int, polygon: Sequence, predicates: str = "eps") -> PolygonVerdict:
+    rings = as_rings(polygon)
+    if len(rings) == 1 and is_trivially_simple(rings[0]):
+        return PolygonVerdict(index, True, [], "trivial")
+    points = list(check_rings(rings, predicates=predicates))
+    return PolygonVerdict(index, not points, points, "sweep")
+
+def _check_chunk(start: int, chunk: List[Sequence], predicates: str) -> List[PolygonVerdict]:
+    return [check_one(start + k, poly, predicates) for k, poly in enumerate(chunk)]
+
+def check_polygons(polygons: Iterable[Sequence], *, workers: Optional[int] = None,
+                   chunksize: int = 256, predicates: str = "eps") -> Iterator[PolygonVerdict]:
+    """
+    Validates many polygons, streaming back one PolygonVerdict per input
+    in input order.
+
+    The input is consumed lazily in chunks of `chunksize` polygons; at
+    most 2 * workers chunks are in flight, so memory stays bounded for
+    arbitrarily long inputs. workers=1 runs in-process.
+    """
+    workers = workers or os.cpu_count() or 1
+    it = iter(polygons)
+    start = 0
+    if workers == 1:
+        for i, poly in enumerate(it):
+            yield check_one(i, poly, predicates)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        while True:
+            while len(pending) < 2 * workers:
+                chunk = list(islice(it, chunksize))
+                if not chunk:
+                    break
+                pending.append(pool.submit(_check_chunk, start, chunk, predicates))
+                start += len(chunk)
+            if not pending:
+                return
+            yield from pending.popleft().result()
+
+def check_polygon_file(path: str, **kw) -> Iterator[PolygonVerdict]:
+    """check_polygons over a file of WKT POLYGON / MULTIPOLYGON lines."""
+    return check_polygons(segment_io.iter_wkt_polygons(path), **kw)
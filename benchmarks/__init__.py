@@ -0,0 +1,3 @@
+## GroupID-20 (22114029_22113078) - Dhruv, Komal
+## Date: Nov 2, 2025
+## benchmarks - Performance harnesses (run from the repo root with python -m)
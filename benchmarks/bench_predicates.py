@@ -0,0 +1,64 @@
+## GroupID-20 (22114029_22113078) - Dhruv, Komal
+## Date: Nov 2, 2025
+## bench_predicates.py - Fast-path rate and cost of the robust predicates
+##
+## Usage: python -m benchmarks.bench_predicates [--pairs N]
+
+import argparse
+import random
+import time
+from typing import List, Tuple
+
+from geometry import segment_intersection, segment_intersection_robust, PREDICATE_STATS
+
+Quad = Tuple[float, float, float, float]
+
+# segment_intersection_robust always makes four orient_robust calls
+ORIENTS_PER_TEST = 4
+
+def random_pairs(n: int, scale: float, offset: float, rng: random.Random) -> List[Tuple[Quad, Quad]]:
+    def seg() -> Quad:
+        return tuple(offset + rng.uniform(0, scale) for _ in range(4))
+    return [(seg(), seg()) for _ in range(n)]
+
+def grid_pairs(n: int, rng: random.Random) -> List[Tuple[Quad, Quad]]:
+    """Small-integer coordinates: many collinear, touching and shared endpoints."""
+    def seg() -> Quad:
+        return tuple(float(rng.randint(0, 8)) for _ in range(4))
+    return [(seg(), seg()) for _ in range(n)]
+
+def run(fn, pairs) -> Tuple[float, int]:
+    t0 = time.perf_counter()
+    hits = 0
+    for (a, b) in pairs:
+        if fn((a[0], a[1]), (a[2], a[3]), (b[0], b[1]), (b[2], b[3])) is not None:
+            hits += 1
+    return time.perf_counter() - t0, hits
+
+def main():
+    ap = argparse.ArgumentParser(description="Robust predicate fast-path benchmark")
+    ap.add_argument("--pairs", type=int, default=200_000)
+    ap.add_argument("--seed", type=int, default=1)
+    args = ap.parse_args()
+    rng = random.Random(args.seed)
+
+    workloads = [
+        ("unit square", random_pairs(args.pairs, 1.0, 0.0, rng)),
+        ("canvas 900px", random_pairs(args.pairs, 900.0, 0.0, rng)),
+        ("projected m ~1e6", random_pairs(args.pairs, 5000.0, 1e6, rng)),
+        ("tiny ~1e-6", random_pairs(args.pairs, 1e-6, 0.0, rng)),
+        ("integer grid", grid_pairs(args.pairs, rng)),
+    ]
+    print(f"{'workload':18} {'eps us/call':>11} {'robust us/call':>14} {'fast path':>9} "
+          f"{'eps hits':>9} {'robust hits':>11}")
+    for name, pairs in workloads:
+        t_eps, h_eps = run(segment_intersection, pairs)
+        PREDICATE_STATS["exact"] = 0
+        t_rob, h_rob = run(segment_intersection_robust, pairs)
+        total = ORIENTS_PER_TEST * len(pairs)
+        fast = total - PREDICATE_STATS["exact"]
+        print(f"{name:18} {1e6*t_eps/len(pairs):11.2f} {1e6*t_rob/len(pairs):14.2f} "
+              f"{100*fast/max(1, total):8.3f}% {h_eps:9d} {h_rob:11d}")
+
+if __name__ == "__main__":
+    main()
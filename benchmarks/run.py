@@ -0,0 +1,143 @@
+## GroupID-20 (22114029_22113078) - Dhruv, Komal
+## Date: Nov 2, 2025
+## run.py - Benchmark runner with JSON results and baseline comparison
+##
+## Usage: python -m benchmarks.run [--sizes 100,1000,10000] [--workloads uniform,grid]
+##                                  [--out bench.json] [--baseline old.json --threshold 0.15]
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, Optional, Tuple
+
+from engine import find_intersections, run_sweep
+from event_queue import EventQueue
+from polygon_checker import PolygonSweep
+from segment import SegmentStore
+from benchmarks.workloads import WORKLOADS
+
+def measure(name: str, n: int, seed: int, method: str, status: Optional[str]) -> Tuple[float, int, int]:
+    """One run: (seconds, events, intersections)."""
+    wl = WORKLOADS[name]
+    data = wl.make(n, random.Random(seed))
+    if wl.polygon:
+        store = SegmentStore()
+        for i in range(len(data)):
+            store.append(data[i], data[(i + 1) % len(data)])
+        sweep = PolygonSweep(store, log_fn=None, status=status or "skiplist")
+        stats = run_sweep(sweep, EventQueue.from_segments(store))
+        return stats.seconds, stats.events, len(sweep.non_adjacent_intersections)
+    t0 = time.perf_counter()
+    result = find_intersections(data, method=method, status=status)
+    return time.perf_counter() - t0, result.stats.events, len(result.points)
+
+def peak_memory(name: str, n: int, seed: int, method: str, status: str) -> int:
+    tracemalloc.start()
+    try:
+        measure(name, n, seed, method, status)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def run_case(name: str, n: int, args) -> Dict:
+    best: Optional[Tuple[float, int, int]] = None
+    for _ in range(args.repeat):
+        r = measure(name, n, args.seed, args.method, args.status)
+        if best is None or r[0] < best[0]:
+            best = r
+    seconds, events, hits = best
+    row = {
+        "workload": name, "n": n, "seconds": seconds, "events": events,
+        "intersections": hits,
+        "events_per_s": events / seconds if seconds else None,
+        "intersections_per_s": hits / seconds if seconds else None,
+        "peak_bytes": None,
+    }
+    if n <= args.memory_max_n:
+        row["peak_bytes"] = peak_memory(name, n, args.seed, args.method, args.status)
+    return row
+
+def compare(results: List[Dict], baseline: Dict, threshold: float,
+            floors: Dict[str, float]) -> List[str]:
+    """
+    Lines describing every case slower (or bigger) than baseline by more
+    than threshold. Cases whose baseline is under floors[key] are too
+    noisy to judge and are skipped.
+    """
+    old = {(r["workload"], r["n"]): r for r in baseline.get("results", [])}
+    regressions = []
+    for r in results:
+        b = old.get((r["workload"], r["n"]))
+        if b is None:
+            continue
+        for key in ("seconds", "peak_bytes"):
+            if not r.get(key) or not b.get(key) or b[key] < floors[key]:
+                continue
+            if r[key] > b[key] * (1 + threshold):
+                regressions.append(f"{r['workload']} n={r['n']}: {key} {b[key]:.4g} -> {r[key]:.4g} "
+                                   f"(+{100*(r[key]/b[key]-1):.1f}%)")
+    return regressions
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Bentley-Ottmann benchmark suite")
+    ap.add_argument("--sizes", default="100,1000,10000",
+                    help="comma-separated n values (1e2 .. 1e6)")
+    ap.add_argument("--workloads", default=",".join(WORKLOADS))
+    ap.add_argument("--method", default="sweep", choices=("sweep", "auto", "brute"))
+    ap.add_argument("--status", default=None, help="sweep status (default skiplist); "
+                    "setting it makes --method auto sweep")
+    ap.add_argument("--repeat", type=int, default=1, help="runs per case, best time kept")
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--memory-max-n", type=int, default=100_000,
+                    help="largest n also re-run under tracemalloc for peak memory")
+    ap.add_argument("--force", action="store_true", help="ignore per-workload size caps")
+    ap.add_argument("--out", default="bench_results.json")
+    ap.add_argument("--baseline", help="earlier --out file to compare against")
+    ap.add_argument("--threshold", type=float, default=0.15,
+                    help="relative slowdown that counts as a regression")
+    ap.add_argument("--min-seconds", type=float, default=0.05,
+                    help="baseline times below this are not compared (timer noise)")
+    ap.add_argument("--min-bytes", type=int, default=1 << 20,
+                    help="baseline peaks below this are not compared")
+    args = ap.parse_args(argv)
+
+    sizes = [int(float(s)) for s in args.sizes.split(",")]
+    results = []
+    for name in args.workloads.split(","):
+        for n in sizes:
+            if n > WORKLOADS[name].max_n and not args.force:
+                print(f"{name:16} n={n:<8} skipped (above max_n={WORKLOADS[name].max_n})")
+                continue
+            row = run_case(name, n, args)
+            results.append(row)
+            mem = f"{row['peak_bytes']/2**20:8.1f} MiB" if row["peak_bytes"] else "       - MiB"
+            print(f"{name:16} n={n:<8} {row['seconds']:9.3f}s {mem} events={row['events']:<9} "
+                  f"k={row['intersections']:<9} {row['intersections_per_s'] or 0:12.0f} k/s")
+
+    report = {
+        "meta": {"python": sys.version.split()[0], "platform": platform.platform(),
+                 "time": time.strftime("%Y-%m-%dT%H:%M:%S"), "method": args.method,
+                 "status": args.status},
+        "results": results,
+    }
+    with open(args.out, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"wrote {args.out}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.threshold,
+                                  {"seconds": args.min_seconds, "peak_bytes": args.min_bytes})
+        for line in regressions:
+            print("REGRESSION", line)
+        if regressions:
+            return 1
+        print(f"no regressions beyond {100*args.threshold:.0f}% against {args.baseline}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
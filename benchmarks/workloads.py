@@ -0,0 +1,101 @@
+## GroupID-20 (22114029_22113078) - Dhruv, Komal
+## Date: Nov 2, 2025
+## workloads.py - Parametrized input generators for the benchmarks
+
+import math
+import random
+from typing import Callable, Dict, List, NamedTuple, Tuple
+
+from geometry import Point
+
+Quad = Tuple[float, float, float, float]
+SIDE = 10_000.0
+
+def uniform(n: int, rng: random.Random) -> List[Quad]:
+    """
+    Random segments like BentleyVisualizer.generate_segments, with length
+    shrinking as 1/sqrt(n) so k grows linearly instead of quadratically.
+    """
+    L = 3 * SIDE / math.sqrt(max(n, 1))
+    out = []
+    for _ in range(n):
+        x, y = rng.uniform(0, SIDE), rng.uniform(0, SIDE)
+        a = rng.uniform(0, 2*math.pi)
+        out.append((x, y, x + L*math.cos(a), y + L*math.sin(a)))
+    return out
+
+def grid(n: int, rng: random.Random) -> List[Quad]:
+    """Long, thin horizontal lines crossed by 8 long vertical ones (k ~ 8n)."""
+    v = min(8, n)
+    out = [(SIDE*(i+0.5)/v, 0.0, SIDE*(i+0.5)/v + rng.uniform(-1e-3, 1e-3), SIDE)
+           for i in range(v)]
+    for i in range(n - v):
+        y = SIDE * (i + 0.5) / max(1, n - v)
+        out.append((0.0, y, SIDE, y + rng.uniform(-1e-3, 1e-3)))
+    return out
+
+def near_parallel(n: int, rng: random.Random) -> List[Quad]:
+    """Bundles of long segments whose slopes differ by ~1e-6."""
+    out = []
+    bundles = max(1, n // 100)
+    for i in range(n):
+        y0 = SIDE * (i % bundles) / bundles
+        out.append((0.0, y0 + rng.uniform(0, 1e-2), SIDE, y0 + rng.uniform(0, 1e-2)))
+    return out
+
+def collinear(n: int, rng: random.Random) -> List[Quad]:
+    """Overlapping pieces of a few lines, half of them sharing endpoints."""
+    lines = max(1, int(math.sqrt(n)) // 4)
+    out = []
+    for i in range(n):
+        y = SIDE * (i % lines) / lines
+        x = float(rng.randint(0, 1000)) * SIDE / 1000
+        out.append((x, y, x + SIDE / 50, y))
+    return out
+
+def shared_endpoints(n: int, rng: random.Random) -> List[Quad]:
+    """Fans of segments leaving a common vertex, plus chains joined end to end."""
+    out = []
+    hubs = max(1, n // 16)
+    centres = [(rng.uniform(0, SIDE), rng.uniform(0, SIDE)) for _ in range(hubs)]
+    for i in range(n):
+        cx, cy = centres[i % hubs]
+        a = rng.uniform(0, 2*math.pi)
+        r = rng.uniform(1, 4 * SIDE / math.sqrt(max(n, 1)))
+        out.append((cx, cy, cx + r*math.cos(a), cy + r*math.sin(a)))
+    return out
+
+def star_polygon(n: int, rng: random.Random) -> List[Point]:
+    """
+    Self-intersecting star: n vertices on a circle visited with step 2
+    (a pentagram for n = 5), giving about n crossings. n is made odd.
+    """
+    n = n | 1
+    pts = [(SIDE/2 + SIDE/2*math.cos(2*math.pi*i/n), SIDE/2 + SIDE/2*math.sin(2*math.pi*i/n))
+           for i in range(n)]
+    return [pts[(2*i) % n] for i in range(n)]
+
+def spiral_polygon(n: int, rng: random.Random) -> List[Point]:
+    """Outward spiral closed by a chord crossing every turn."""
+    turns = max(2, int(math.sqrt(n)) // 4)
+    pts = []
+    for i in range(n):
+        t = 2*math.pi*turns*i/n
+        r = SIDE/2 * (0.05 + 0.95*i/n)
+        pts.append((SIDE/2 + r*math.cos(t), SIDE/2 + r*math.sin(t)))
+    return pts
+
+class Workload(NamedTuple):
+    make: Callable[[int, random.Random], list]
+    polygon: bool          # vertices for check_polygon rather than segments
+    max_n: int             # larger sizes are skipped unless forced
+
+WORKLOADS: Dict[str, Workload] = {
+    "uniform": Workload(uniform, False, 1_000_000),
+    "grid": Workload(grid, False, 1_000_000),
+    "near_parallel": Workload(near_parallel, False, 100_000),
+    "collinear": Workload(collinear, False, 100_000),
+    "shared_endpoints": Workload(shared_endpoints, False, 1_000_000),
+    "star_polygon": Workload(star_polygon, True, 1_000_000),
+    "spiral_polygon": Workload(spiral_polygon, True, 1_000_000),
+}
@@ -0,0 +1,94 @@
+## GroupID-20 (22114029_22113078) - Dhruv, Komal
+## Date: Nov 5, 2025
+## dynamic.py - Intersections of a segment set under insertions and deletions
+
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from geometry import Point, segment_intersection
+from grid_index import MAX_SEGMENT_CELLS, UniformGrid
+from intersection_set import IntersectionSet
+from engine import as_segments
+from segment_index import SegmentIndex
+
+Pair = Tuple[int, int]
+
+class DynamicIntersections:
+    """
+    Keeps every pairwise intersection of an editable segment set.
+
+    Segments get stable ids. insert_segment tests the new segment only
+    against the segments sharing a grid cell with it, and delete_segment
+    drops exactly the intersections that involved it, so an edit costs
+    time proportional to the segments near it rather than a full sweep.
+    Pairs are tested with geometry.segment_intersection, like the sweep.
+
+    The grid cell defaults to SegmentIndex.default_cell of the initial
+    segments; with none, `cell` must be given, as no default fits every
+    coordinate unit. Segments longer than `max_cells` cells are checked
+    against every edit instead of filed (see UniformGrid).
+    """
+    def __init__(self, segments: Iterable = (), cell: Optional[float] = None,
+                 max_cells: Optional[int] = MAX_SEGMENT_CELLS):
+        store = as_segments(segments)
+        if cell is None:
+            if not len(store):
+                raise ValueError("DynamicIntersections needs `cell` when it starts empty")
+            cell = SegmentIndex.default_cell(store)
+        self.grid = UniformGrid(cell, max_cells)
+        self.segs: Dict[int, Tuple[Point, Point]] = {}
+        self.hits: Dict[Pair, Point] = {}
+        self.by_seg: Dict[int, Set[int]] = {}
+        self._next_id = 0
+        for i in range(len(store)):
+            self.insert_segment(*store.endpoints(i))
+
+    def __len__(self) -> int:
+        return len(self.segs)
+
+    def __contains__(self, seg_id: int) -> bool:
+        return seg_id in self.segs
+
+    def intersections(self) -> List[Point]:
+        """Distinct intersection points."""
+        points = IntersectionSet()
+        for pair, (x, y) in self.hits.items():
+            points.add(x, y, pair)
+        return points.points
+
+    def crossings(self, seg_id: int) -> List[Tuple[int, Point]]:
+        """(other segment, point) for every intersection of seg_id."""
+        return sorted((f, self.hits[(seg_id, f) if seg_id < f else (f, seg_id)])
+                      for f in self.by_seg.get(seg_id, ()))
+
+    def insert_segment(self, a: Point, b: Point) -> int:
+        """Adds segment a-b and its intersections; returns its id."""
+        e = self._next_id
+        self._next_id += 1
+        self._add(e, a, b)
+        return e
+
+    def delete_segment(self, seg_id: int):
+        """Removes seg_id and every intersection it took part in."""
+        del self.segs[seg_id]
+        self.grid.remove(seg_id)
+        for f in self.by_seg.pop(seg_id, ()):
+            del self.hits[(seg_id, f) if seg_id < f else (f, seg_id)]
+            others = self.by_seg[f]
+            others.discard(seg_id)
+            if not others:
+                del self.by_seg[f]
+
+    def move_segment(self, seg_id: int, a: Point, b: Point):
+        """Replaces the geometry of seg_id by a-b, keeping its id."""
+        self.delete_segment(seg_id)
+        self._add(seg_id, a, b)
+
+    def _add(self, e: int, a: Point, b: Point):
+        for f in self.grid.candidates(a, b):
+            r = segment_intersection(a, b, *self.segs[f])
+            if r:
+                self.hits[(e, f) if e < f else (f, e)] = r
+                self.by_seg.setdefault(e, set()).add(f)
+                self.by_seg.setdefault(f, set()).add(e)
+        self.segs[e] = (a, b)
+        self.grid.insert(e, a, b)
@@ -0,0 +1,241 @@
+## GroupID-20 (22114029_22113078) - Dhruv, Komal
+## Date: Oct 30, 2025
+## engine.py - Headless sweep driver and batch API (no tkinter needed)
+
+import time
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+from geometry import Point, EPS
+from segment import Segment, SegmentStore
+from sweep_line import SweepLine
+from event_queue import EventQueue
+from sweep_trace import TRACE_OFF
+from sweep_metrics import SweepMetrics
+from segment_io import MappedSegments
+from intersection_set import IntersectionSet
+import vectorized
+from vectorized import HAVE_NUMPY
+
+Pair = Tuple[int, int]
+
+# run_sweep polls its cancel flag and reports progress every this many events
+CHECK_EVERY = 1024
+
+class SweepCancelled(Exception):
+    """Raised by run_sweep when its cancel flag is set."""
+
+class SweepStats(NamedTuple):
+    """
+    Run statistics. events .. max_status describe a sweep and are 0 for
+    method "brute", which reports pairs_tested / pairs_hit instead.
+    """
+    segments: int
+    events: int                # events popped from the queue
+    intersection_events: int   # of which 'I' events
+    duplicates: int            # 'I' events dropped as already queued
+    max_status: int            # largest status size seen
+    seconds: float
+    points: int = 0            # distinct intersection points found
+    method: str = "sweep"      # "sweep" or "brute"
+    pairs_tested: int = 0      # brute: candidate pairs, n * (n - 1) / 2
+    pairs_hit: int = 0         # brute: pairs that intersect
+
+class SweepResult(NamedTuple):
+    points: List[Point]
+    pairs: List[List[Pair]]    # pairs[i] produced points[i]
+    stats: SweepStats
+
+class Witness(NamedTuple):
+    pair: Pair
+    point: Point
+
+def as_segments(segments: Iterable) -> SegmentStore:
+    """
+    Accepts a SegmentStore, a memory-mapped segment file, Segments or plain
+    ((x1, y1), (x2, y2)) / (x1, y1, x2, y2) tuples, and returns a
+    SegmentStore whose ids are the input positions.
+    """
+    if isinstance(segments, (SegmentStore, MappedSegments)):
+        return SegmentStore.from_segments(segments)
+    store = SegmentStore()
+    for s in segments:
+        if isinstance(s, Segment):
+            store.append(s.a, s.b)
+        elif len(s) == 4:
+            store.append((s[0], s[1]), (s[2], s[3]))
+        else:
+            store.append(tuple(s[0]), tuple(s[1]))
+    return store
+
+def run_sweep(sweep: SweepLine, queue: EventQueue, cancel=None, progress_fn=None) -> SweepStats:
+    """
+    Drains queue through sweep and returns run statistics.
+
+    For callers on another thread: `cancel` is anything with is_set()
+    (e.g. a threading.Event), polled every CHECK_EVERY events, and stops
+    the sweep with SweepCancelled; `progress_fn(fraction)` is called as
+    often with the share of endpoint events processed so far.
+    """
+    trace = sweep.trace
+    events = i_events = duplicates = max_status = 0
+    endpoint_events = 2 * len(sweep.segments) or 1
+    t0 = time.perf_counter()
+    while queue:
+        ev = queue.pop()
+        events += 1
+        if ev.type == 'I':
+            i_events += 1
+        if events % CHECK_EVERY == 0:
+            if cancel is not None and cancel.is_set():
+                raise SweepCancelled()
+            if progress_fn is not None:
+                progress_fn((events - i_events) / endpoint_events)
+        for new_ev in sweep.process_event(ev):
+            if queue.push(new_ev):
+                if trace.debug:
+                    trace.emit("SCHEDULING new: {} at ({:.2f}, {:.2f})", new_ev.type, new_ev.x, new_ev.y)
+            else:
+                duplicates += 1
+                if sweep.metrics is not None:
+                    sweep.metrics.duplicates += 1
+        if len(sweep.status) > max_status:
+            max_status = len(sweep.status)
+        if sweep.intersections.window:
+            sweep.intersections.evict_before(sweep.sweep_x - EPS)
+    return SweepStats(len(sweep.segments), events, i_events, duplicates, max_status,
+                      time.perf_counter() - t0, sweep.intersections.total)
+
+def run_sweep_into(sweep: SweepLine, queue: EventQueue, sink) -> SweepStats:
+    """
+    run_sweep that hands every new (point, pair) to sink.add(x, y, pair)
+    (see sinks.py) instead of keeping the points: the sweep's
+    IntersectionSet only holds the points near the sweep front, so memory
+    is O(n + queued events) whatever the number of intersections.
+    """
+    sweep.intersections = IntersectionSet(window=True, on_add=sink.add)
+    return run_sweep(sweep, queue)
+
+def first_intersection_sweep(sweep: SweepLine) -> Optional[Witness]:
+    """
+    Shamos-Hoey: sweeps only the endpoint events of sweep.segments and
+    stops at the first crossing sweep._reportable accepts.
+
+    No 'I' events are ever scheduled, so the status never needs a swap:
+    until the first crossing is found, the order of the status is valid
+    at every endpoint. Vertical segments are tested against the status
+    range they span (SweepLine.vertical_pairs). Runs in O(n log n) time and O(n) memory whatever
+    the number of intersections.
+    """
+    segs = sweep.segments
+    endpoints, intersect, reportable = segs.endpoints, sweep._intersect, sweep._reportable
+    for x, _y, code, sid, _ in sorted(segs.packed_endpoint_events()):
+        sweep.sweep_x = x
+        if code == 1 and sweep.is_vertical(sid):
+            pairs = sweep.vertical_pairs(sid, x)
+        elif code == 1:
+            pairs = sweep.segment_pairs_at_x(sid, x)
+            below, above = sweep.insert_status(sid, x)
+            pairs += [(sid, nb) for nb in (below, above) if nb is not None]
+        elif sweep.is_vertical(sid):
+            continue
+        else:
+            below, above = sweep.remove_status(sid)
+            pairs = [(below, above)] if below is not None and above is not None else []
+        for s1, s2 in pairs:
+            if not reportable(s1, s2):
+                continue
+            r = intersect(*endpoints(s1), *endpoints(s2))
+            if r:
+                return Witness((s1, s2) if s1 < s2 else (s2, s1), r)
+    return None
+
+def first_intersection(segments: Sequence, *, status: str = "skiplist",
+                       predicates: str = "eps") -> Optional[Witness]:
+    """
+    Early-exit "is there any intersection?" query: returns one crossing
+    pair and its point, or None, without building the intersection list.
+    The witness is a crossing, not necessarily the leftmost one.
+    """
+    segs = as_segments(segments)
+    return first_intersection_sweep(SweepLine(segs, log_fn=None, status=status,
+                                              predicates=predicates))
+
+def has_intersection(segments: Sequence, **kw) -> bool:
+    return first_intersection(segments, **kw) is not None
+
+def find_intersections_into(segments: Sequence, sink, *, status: str = "skiplist",
+                            predicates: str = "eps",
+                            metrics: Optional[SweepMetrics] = None) -> SweepStats:
+    """
+    find_intersections writing to `sink` (e.g. sinks.CountSink) instead of
+    building the result lists. stats.points is the number of distinct
+    points; the sink sees every (point, pair) once.
+    """
+    segs = as_segments(segments)
+    sweep = SweepLine(segs, log_fn=None, status=status, predicates=predicates,
+                      metrics=metrics)
+    return run_sweep_into(sweep, EventQueue.from_segments(segs), sink)
+
+def iter_intersections(segments: Sequence, *, status: str = "skiplist",
+                       predicates: str = "eps") -> Iterator[Tuple[Point, Pair]]:
+    """
+    Generator version of find_intersections: yields (point, pair) in sweep
+    order while the sweep runs, once per new pair at a point. Points are
+    forgotten once the sweep has moved past them, so memory is bounded by
+    the input and the event queue rather than by the number of results.
+    """
+    segs = as_segments(segments)
+    found: List[Tuple[Point, Pair]] = []
+    sweep = SweepLine(segs, log_fn=None, status=status, predicates=predicates)
+    sweep.intersections = IntersectionSet(window=True,
+                                          on_add=lambda x, y, pair: found.append(((x, y), pair)))
+    queue = EventQueue.from_segments(segs)
+    while queue:
+        for new_ev in sweep.process_event(queue.pop()):
+            queue.push(new_ev)
+        if found:
+            yield from found
+            found.clear()
+        sweep.intersections.evict_before(sweep.sweep_x - EPS)
+
+def brute_force_intersections(segs: SegmentStore) -> SweepResult:
+    """Tiled all-pairs pass through the NumPy kernel (see vectorized.py)."""
+    t0 = time.perf_counter()
+    found = []
+    for i, j, xs, ys in vectorized.brute_force(vectorized.as_array(segs)):
+        found.extend(zip(xs.tolist(), ys.tolist(), i.tolist(), j.tolist()))
+    found.sort()    # report in sweep order, like the sweep does
+    points = IntersectionSet()
+    for x, y, i, j in found:
+        points.add(x, y, (i, j))
+    n = len(segs)
+    stats = SweepStats(n, 0, 0, 0, 0, time.perf_counter() - t0, len(points),
+                       method="brute", pairs_tested=n * (n - 1) // 2, pairs_hit=len(found))
+    return SweepResult(points.points, points.pairs, stats)
+
+def find_intersections(segments: Sequence, *, method: str = "auto", status: Optional[str] = None,
+                       trace_level: int = TRACE_OFF, log_fn=print,
+                       predicates: str = "eps", metrics: Optional[SweepMetrics] = None
+                       ) -> SweepResult:
+    """
+    Runs Bentley-Ottmann over `segments` and returns every intersection
+    point with the segment pairs that produced it.
+
+    Only messages up to `trace_level` are built and passed to `log_fn`;
+    with the default TRACE_OFF the sweep formats no strings at all.
+    `method` is "sweep", "brute" (NumPy all-pairs) or "auto", which picks
+    brute force when NumPy is available and the sampled density says k
+    is large enough for the sweep not to pay off. Anything only the sweep
+    honours makes "auto" sweep: a `status` (default "skiplist"), a trace
+    level, the "robust" predicates (the kernel implements "eps" only) or
+    a SweepMetrics to fill in. Brute force logs nothing and reports its
+    work in stats.pairs_tested / pairs_hit (see SweepStats).
+    """
+    segs = as_segments(segments)
+    if method == "brute" or (method == "auto" and HAVE_NUMPY and status is None
+                             and trace_level == TRACE_OFF and predicates == "eps"
+                             and metrics is None and vectorized.prefer_brute_force(segs)):
+        return brute_force_intersections(segs)
+    sweep = SweepLine(segs, log_fn=log_fn, status=status or "skiplist", trace_level=trace_level,
+                      predicates=predicates, metrics=metrics)
+    stats = run_sweep(sweep, EventQueue.from_segments(segs))
+    return SweepResult(sweep.intersections.points, sweep.intersections.pairs, stats)
@@ -0,0 +1,86 @@
+## GroupID-20 (22114029_22113078) - Dhruv, Komal
+## Date: Oct 30, 2025
+## event_queue.py - Heap-based event queue with intersection dedup
+
+import heapq
+from typing import Iterable, List, Set, Tuple
+from geometry import quantize
+from segment import Event, PackedEvent, SegmentStore, pack_event, unpack_event
+
+DedupKey = Tuple[int, int, int, int]
+
+class EventQueue:
+    """
+    Binary-heap event queue shared by the sweep drivers.
+
+    Events are stored packed (see segment.pack_event): flat tuples without
+    the nested seg_ids tuple or type string, unpacked again on pop.
+
+    'I' events are deduplicated in O(1): each queued intersection is hashed
+    by its unordered segment pair and EPS-quantized point, and a new one is
+    dropped if the same pair is already queued in the same or a
+    neighbouring cell.
+    """
+    def __init__(self, events: Iterable[Event] = ()):
+        self.heap: List[PackedEvent] = [pack_event(ev) for ev in events]
+        self._init_heap()
+
+    def _init_heap(self):
+        heapq.heapify(self.heap)
+        self.pending: Set[DedupKey] = set()
+        for p in self.heap:
+            if p[2] == 0:
+                self.pending.add(self._key(p))
+
+    @classmethod
+    def from_segments(cls, segments: Iterable) -> "EventQueue":
+        """Builds the initial queue of left/right endpoint events."""
+        queue = cls()
+        queue.heap = list(SegmentStore.from_segments(segments).packed_endpoint_events())
+        queue._init_heap()
+        return queue
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def __bool__(self) -> bool:
+        return bool(self.heap)
+
+    @staticmethod
+    def _key(p: PackedEvent) -> DedupKey:
+        x, y, _, s1, s2 = p
+        lo, hi = (s1, s2) if s1 < s2 else (s2, s1)
+        cx, cy = quantize(x, y)
+        return (lo, hi, cx, cy)
+
+    def is_duplicate(self, ev: Event) -> bool:
+        return self._is_duplicate(pack_event(ev))
+
+    def _is_duplicate(self, p: PackedEvent) -> bool:
+        if p[2] != 0:
+            return False
+        lo, hi, cx, cy = self._key(p)
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                if (lo, hi, cx+dx, cy+dy) in self.pending:
+                    return True
+        return False
+
+    def push(self, ev: Event) -> bool:
+        """Queues ev; returns False if it duplicates a queued 'I' event."""
+        p = pack_event(ev)
+        if p[2] == 0:
+            if self._is_duplicate(p):
+                return False
+            self.pending.add(self._key(p))
+        heapq.heappush(self.heap, p)
+        return True
+
+    def pop(self) -> Event:
+        p = heapq.heappop(self.heap)
+        if p[2] == 0:
+            self.pending.discard(self._key(p))
+        return unpack_event(p)
+
+    def peek(self) -> Event:
+        return unpack_event(self.heap[0])
@@ -2,6 +2,8 @@
 ## Date: Oct 28, 2025
 ## geometry.py - Geometry utility functions
  
+import sys
+from fractions import Fraction
 from typing import Tuple, Optional
 
 Point = Tuple[float, float]
@@ -42,3 +44,77 @@ def y_at(seg: Tuple[Point, Point], x: float) -> float:
         return min(a[1], b[1])
     t = (x - a[0]) / (b[0]-a[0])
     return a[1] + t*(b[1]-a[1])
+
+def quantize(x: float, y: float, cell: float = EPS) -> Tuple[int, int]:
+    """Grid cell of (x, y); points within `cell` lie in neighbouring cells."""
+    return (int(x // cell), int(y // cell))
+
+# --- robust predicates: float filter with exact fallback ---
+# Forward error bound of the floating-point orient determinant (Shewchuk,
+# "Adaptive Precision Floating-Point Arithmetic and Fast Robust Geometric
+# Predicates"): if |det| exceeds it, the float sign is the exact sign.
+_U = 2.0 ** -53
+ORIENT_ERRBOUND = (3.0 + 16.0 * _U) * _U
+# the bound is relative, so it fails once the products underflow: below
+# this errbound (the smallest normal double) the exact path decides
+_MIN_ERRBOUND = sys.float_info.min
+
+# how many robust orient calls needed exact arithmetic; the fast path is
+# not counted, to keep it cheap (callers know how many calls they made)
+PREDICATE_STATS = {"exact": 0}
+
+def orient_exact(a: Point, b: Point, c: Point) -> Fraction:
+    ax, ay = Fraction(a[0]), Fraction(a[1])
+    return (Fraction(b[0])-ax)*(Fraction(c[1])-ay) - (Fraction(b[1])-ay)*(Fraction(c[0])-ax)
+
+def orient_robust(a: Point, b: Point, c: Point) -> float:
+    """orient with an exact sign; the magnitude is only approximate (just +-1.0 off the fast path)."""
+    detleft = (b[0]-a[0])*(c[1]-a[1])
+    detright = (b[1]-a[1])*(c[0]-a[0])
+    det = detleft - detright
+    errbound = ORIENT_ERRBOUND * (abs(detleft) + abs(detright))
+    if errbound >= _MIN_ERRBOUND and (det > errbound or -det > errbound):
+        return det
+    PREDICATE_STATS["exact"] += 1
+    exact = orient_exact(a, b, c)
+    if not exact:
+        return 0.0
+    return 1.0 if exact > 0 else -1.0
+
+def on_segment_exact(a: Point, b: Point, c: Point) -> bool:
+    return min(a[0], c[0]) <= b[0] <= max(a[0], c[0]) and \
+           min(a[1], c[1]) <= b[1] <= max(a[1], c[1])
+
+def segment_intersection_robust(p1: Point, q1: Point, p2: Point, q2: Point) -> Optional[Point]:
+    """
+    segment_intersection with exact orientation signs instead of the
+    absolute EPS tests, so the answer does not depend on coordinate scale.
+    """
+    o1, o2 = orient_robust(p1, q1, p2), orient_robust(p1, q1, q2)
+    o3, o4 = orient_robust(p2, q2, p1), orient_robust(p2, q2, q1)
+
+    # general case: strict sign changes on both segments
+    if ((o1 > 0 > o2) or (o1 < 0 < o2)) and ((o3 > 0 > o4) or (o3 < 0 < o4)):
+        # parametric form around p1 keeps precision for large coordinates
+        dx1, dy1 = q1[0]-p1[0], q1[1]-p1[1]
+        dx2, dy2 = q2[0]-p2[0], q2[1]-p2[1]
+        den = dx1*dy2 - dy1*dx2
+        if den == 0.0:     # rounded to zero although the lines do cross
+            num = (Fraction(p2[0])-Fraction(p1[0]))*Fraction(dy2) - \
+                  (Fraction(p2[1])-Fraction(p1[1]))*Fraction(dx2)
+            t = float(num / (Fraction(dx1)*Fraction(dy2) - Fraction(dy1)*Fraction(dx2)))
+        else:
+            t = ((p2[0]-p1[0])*dy2 - (p2[1]-p1[1])*dx2) / den
+        return (p1[0] + t*dx1, p1[1] + t*dy1)
+
+    # touching / collinear cases, same priority as segment_intersection
+    if o1 == 0 and on_segment_exact(p1, p2, q1): return p2
+    if o2 == 0 and on_segment_exact(p1, q2, q1): return q2
+    if o3 == 0 and on_segment_exact(p2, p1, q2): return p1
+    if o4 == 0 and on_segment_exact(p2, q1, q2): return q1
+    return None
+
+PREDICATES = {
+    "eps": segment_intersection,
+    "robust": segment_intersection_robust,
+}
@@ -0,0 +1,98 @@
+## GroupID-20 (22114029_22113078) - Dhruv, Komal
+## Date: Nov 3, 2025
+## grid_index.py - Uniform-grid spatial index over segments
+
+import math
+from typing import Dict, Hashable, Iterator, List, Optional, Set, Tuple
+from geometry import Point, EPS
+
+Cell = Tuple[int, int]
+
+# default cap on the cells one segment is filed under (see UniformGrid)
+MAX_SEGMENT_CELLS = 1024
+
+def segment_cells(a: Point, b: Point, cell: float) -> Iterator[Cell]:
+    """
+    Every grid cell the segment a-b passes through (padded by EPS): one
+    column at a time, with the y-range the segment covers in that column.
+    """
+    (x0, y0), (x1, y1) = (a, b) if a[0] <= b[0] else (b, a)
+    cx0 = math.floor((x0 - EPS) / cell)
+    cx1 = math.floor((x1 + EPS) / cell)
+    dx = x1 - x0
+    for cx in range(cx0, cx1 + 1):
+        if dx < EPS:
+            ya, yb = y0, y1
+        else:
+            xa = max(x0, cx * cell)
+            xb = min(x1, (cx + 1) * cell)
+            ya = y0 + (y1 - y0) * (xa - x0) / dx
+            yb = y0 + (y1 - y0) * (xb - x0) / dx
+        lo, hi = (ya, yb) if ya <= yb else (yb, ya)
+        for cy in range(math.floor((lo - EPS) / cell), math.floor((hi + EPS) / cell) + 1):
+            yield (cx, cy)
+
+class UniformGrid:
+    """
+    Hash grid mapping cells to the keys of the segments crossing them.
+
+    Insert/remove touch only the cells along a segment, and candidate
+    queries return the keys sharing at least one cell with the query, so
+    the cost depends on local density rather than on the number of
+    segments indexed.
+
+    With `max_cells`, a segment that would cross more cells than that is
+    not filed cell by cell but kept in `oversize`, which every query
+    returns: a few long segments then cost a scan each instead of
+    thousands of buckets.
+    """
+    def __init__(self, cell: float, max_cells: Optional[int] = None):
+        self.cell = cell
+        self.max_cells = max_cells
+        self.cells: Dict[Cell, Set[Hashable]] = {}
+        self.key_cells: Dict[Hashable, List[Cell]] = {}
+        self.oversize: Set[Hashable] = set()
+
+    def __len__(self) -> int:
+        return len(self.key_cells)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.key_cells
+
+    def insert(self, key: Hashable, a: Point, b: Point):
+        if self.max_cells is not None and \
+           (abs(b[0] - a[0]) + abs(b[1] - a[1])) / self.cell + 2 > self.max_cells:
+            self.oversize.add(key)
+            self.key_cells[key] = []
+            return
+        cells = list(segment_cells(a, b, self.cell))
+        for c in cells:
+            self.cells.setdefault(c, set()).add(key)
+        self.key_cells[key] = cells
+
+    def remove(self, key: Hashable):
+        self.oversize.discard(key)
+        for c in self.key_cells.pop(key):
+            bucket = self.cells[c]
+            bucket.discard(key)
+            if not bucket:
+                del self.cells[c]
+
+    def candidates(self, a: Point, b: Point) -> Set[Hashable]:
+        """Keys of indexed segments sharing a cell with a-b (and the oversize ones)."""
+        out: Set[Hashable] = set(self.oversize)
+        for c in segment_cells(a, b, self.cell):
+            bucket = self.cells.get(c)
+            if bucket:
+                out |= bucket
+        return out
+
+    def query_box(self, xmin: float, ymin: float, xmax: float, ymax: float) -> Set[Hashable]:
+        """Keys of indexed segments sharing a cell with the rectangle (and the oversize ones)."""
+        out: Set[Hashable] = set(self.oversize)
+        for cx in range(math.floor((xmin - EPS) / self.cell), math.floor((xmax + EPS) / self.cell) + 1):
+            for cy in range(math.floor((ymin - EPS) / self.cell), math.floor((ymax + EPS) / self.cell) + 1):
+                bucket = self.cells.get((cx, cy))
+                if bucket:
+                    out |= bucket
+        return out
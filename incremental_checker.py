@@ -0,0 +1,138 @@
+## GroupID-20 (22114029_22113078) - Dhruv, Komal
+## Date: Nov 3, 2025
+## incremental_checker.py - Incremental polygon self-intersection checking
+
+from typing import Dict, List, Optional, Set, Tuple
+
+from geometry import Point, segment_intersection
+from grid_index import UniformGrid
+from intersection_set import IntersectionSet
+
+Pair = Tuple[int, int]
+
+class IncrementalPolygonChecker:
+    """
+    Keeps the self-intersections of a closed polygon up to date while its
+    vertices are edited.
+
+    Vertices get stable ids and are kept in a doubly linked ring; the edge
+    leaving vertex u is keyed by u. An edit drops and re-tests only the
+    (at most two) edges it changes, including the closing edge, against a
+    uniform-grid index of the others, so its cost depends on the edges
+    near the change rather than on the polygon size. Like PolygonSweep,
+    intersections between adjacent edges are ignored.
+    """
+    def __init__(self, cell: float = 32.0):
+        self.pos: Dict[int, Point] = {}
+        self.next: Dict[int, int] = {}
+        self.prev: Dict[int, int] = {}
+        self.first: Optional[int] = None
+        self.grid = UniformGrid(cell)
+        self.hits: Dict[Pair, Point] = {}
+        self.by_edge: Dict[int, Set[int]] = {}
+        self._next_id = 0
+
+    def __len__(self) -> int:
+        return len(self.pos)
+
+    def vertices(self) -> List[Point]:
+        """Vertices in polygon order."""
+        out: List[Point] = []
+        v = self.first
+        for _ in range(len(self.pos)):
+            out.append(self.pos[v])
+            v = self.next[v]
+        return out
+
+    def intersections(self) -> List[Point]:
+        """Distinct self-intersection points."""
+        points = IntersectionSet()
+        for pair, (x, y) in self.hits.items():
+            points.add(x, y, pair)
+        return points.points
+
+    def is_simple(self) -> bool:
+        return not self.hits
+
+    # --- edits ---
+
+    def add_vertex(self, p: Point, after: Optional[int] = None) -> int:
+        """Inserts p after vertex `after` (default: the last vertex); returns its id."""
+        v = self._next_id
+        self._next_id += 1
+        self.pos[v] = p
+        if self.first is None:
+            self.first = self.next[v] = self.prev[v] = v
+            return v
+        u = self.prev[self.first] if after is None else after
+        w = self.next[u]
+        self._drop_edge(u)
+        self.next[u], self.prev[v], self.next[v], self.prev[w] = v, u, w, v
+        if len(self.pos) == 3:
+            self._add_all_edges()
+        elif len(self.pos) > 3:
+            self._add_edge(u)
+            self._add_edge(v)
+        return v
+
+    def move_vertex(self, v: int, p: Point):
+        u = self.prev[v]
+        self._drop_edge(u)
+        self._drop_edge(v)
+        self.pos[v] = p
+        if len(self.pos) >= 3:
+            self._add_edge(u)
+            self._add_edge(v)
+
+    def remove_vertex(self, v: int):
+        u, w = self.prev[v], self.next[v]
+        self._drop_edge(u)
+        self._drop_edge(v)
+        del self.pos[v], self.next[v], self.prev[v]
+        if not self.pos:
+            self.first = None
+            return
+        self.next[u], self.prev[w] = w, u
+        if self.first == v:
+            self.first = w
+        if len(self.pos) >= 3:
+            self._add_edge(u)
+        else:
+            for e in list(self.grid.key_cells):
+                self._drop_edge(e)
+
+    def clear(self):
+        self.__init__(self.grid.cell)
+
+    # --- edge bookkeeping ---
+
+    def _adjacent(self, e1: int, e2: int) -> bool:
+        return self.next[e1] == e2 or self.next[e2] == e1
+
+    def _add_all_edges(self):
+        for e in list(self.pos):
+            if e not in self.grid:
+                self._add_edge(e)
+
+    def _add_edge(self, e: int):
+        a, b = self.pos[e], self.pos[self.next[e]]
+        for f in self.grid.candidates(a, b):
+            if f == e or self._adjacent(e, f):
+                continue
+            r = segment_intersection(a, b, self.pos[f], self.pos[self.next[f]])
+            if r:
+                self.hits[(e, f) if e < f else (f, e)] = r
+                self.by_edge.setdefault(e, set()).add(f)
+                self.by_edge.setdefault(f, set()).add(e)
+        self.grid.insert(e, a, b)
+
+    def _drop_edge(self, e: int):
+        if e not in self.grid:
+            return
+        self.grid.remove(e)
+        for f in self.by_edge.pop(e, ()):
+            del self.hits[(e, f) if e < f else (f, e)]
+            others = self.by_edge[f]
+            others.discard(e)
+            if not others:
+                del self.by_edge[f]
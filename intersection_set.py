@@ -0,0 +1,88 @@
+## GroupID-20 (22114029_22113078) - Dhruv, Komal
+## Date: Oct 30, 2025
+## intersection_set.py - Spatial-hash set of reported intersections
+
+from collections import deque
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from geometry import Point, quantize, EPS
+
+Pair = Tuple[int, int]
+OnAdd = Callable[[float, float, Pair], None]
+
+class IntersectionSet:
+    """
+    Intersection points hashed on an EPS grid, each stored once together
+    with the segment pairs that produced it.
+
+    A point within EPS of an existing one lies in the same or a
+    neighbouring cell, so lookups check at most 9 cells: O(1) per add
+    instead of a scan over every point found so far.
+
+    With `window=True` only points near the sweep front are kept (see
+    evict_before), so memory does not grow with the number of points;
+    `on_add(x, y, pair)` is then the way to consume them, and is called
+    once for every new (point, pair).
+    """
+    def __init__(self, window: bool = False, on_add: Optional[OnAdd] = None):
+        self.window = window
+        self.on_add = on_add
+        self.points = deque() if window else []
+        self.pairs = deque() if window else []
+        self.cells: Dict[Tuple[int, int], List[int]] = {}
+        self.base = 0       # number of evicted points; cells hold absolute indices
+        self.total = 0      # points ever added, evicted ones included
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def __iter__(self) -> Iterator[Point]:
+        return iter(self.points)
+
+    def __getitem__(self, i: int) -> Point:
+        return self.points[i]
+
+    def find(self, x: float, y: float) -> Optional[int]:
+        """Index of a stored point within EPS of (x, y), or None."""
+        cx, cy = quantize(x, y)
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for i in self.cells.get((cx+dx, cy+dy), ()):
+                    x0, y0 = self.points[i - self.base]
+                    if abs(x-x0) < EPS and abs(y-y0) < EPS:
+                        return i - self.base
+        return None
+
+    def add(self, x: float, y: float, pair: Optional[Pair] = None) -> bool:
+        """Adds (x, y) for pair; returns False if the point was already known."""
+        if pair is not None:
+            pair = (pair[0], pair[1]) if pair[0] < pair[1] else (pair[1], pair[0])
+        i = self.find(x, y)
+        if i is not None:
+            if pair is not None and pair not in self.pairs[i]:
+                self.pairs[i].append(pair)
+                if self.on_add is not None:
+                    x0, y0 = self.points[i]
+                    self.on_add(x0, y0, pair)
+            return False
+        self.cells.setdefault(quantize(x, y), []).append(self.base + len(self.points))
+        self.points.append((x, y))
+        self.pairs.append([pair] if pair is not None else [])
+        self.total += 1
+        if self.on_add is not None:
+            self.on_add(x, y, pair)
+        return True
+
+    def evict_before(self, x: float):
+        """Window mode: drops points left of x, which no new point can match."""
+        while self.points and self.points[0][0] < x:
+            px, py = self.points.popleft()
+            self.pairs.popleft()
+            cell = quantize(px, py)
+            bucket = self.cells[cell]
+            bucket.remove(self.base)
+            if not bucket:
+                del self.cells[cell]
+            self.base += 1
+
+    def items(self) -> Iterator[Tuple[Point, List[Pair]]]:
+        return zip(self.points, self.pairs)
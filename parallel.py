@@ -0,0 +1,146 @@
+## GroupID-20 (22114029_22113078) - Dhruv, Komal
+## Date: Oct 31, 2025
+## parallel.py - Slab-decomposed sweep across a process pool
+
+import os
+import time
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Sequence, Tuple
+
+from geometry import Point, EPS
+from segment import SegmentStore, Event
+from sweep_line import SweepLine
+from polygon_checker import PolygonSweep
+from event_queue import EventQueue
+from intersection_set import IntersectionSet
+from engine import SweepResult, SweepStats, as_segments
+
+# (global id, x1, y1, x2, y2) as shipped to the workers
+SegRow = Tuple[int, float, float, float, float]
+Hit = Tuple[float, float, int, int]
+
+class _SlabPolygonSweep(PolygonSweep):
+    """PolygonSweep over a slab's local ids, tested for adjacency by global id."""
+    def __init__(self, segments: SegmentStore, gids: List[int], n: int):
+        super().__init__(segments, log_fn=None)
+        self.gids = gids
+        self.n = n
+
+    def _are_adjacent(self, s1_id: int, s2_id: int) -> bool:
+        return super()._are_adjacent(self.gids[s1_id], self.gids[s2_id])
+
+def slab_bounds(segments: SegmentStore, slabs: int) -> List[float]:
+    """
+    Interior slab boundaries chosen at endpoint-count quantiles, so every
+    slab sees about the same number of L/R events.
+    """
+    xs = sorted(segments.x1 + segments.x2)
+    bounds: List[float] = []
+    for k in range(1, slabs):
+        x = xs[k * len(xs) // slabs]
+        if (not bounds or x > bounds[-1]) and x > xs[0]:
+            bounds.append(x)
+    return bounds
+
+def _sweep_slab(rows: List[SegRow], x_lo: float, x_hi: float, pad: float,
+                polygon_n: Optional[int]) -> Tuple[List[Hit], int]:
+    """
+    Sweeps one slab. Segments are inserted and removed at the slab's
+    (padded) borders, so geometry stays exact while no events outside
+    the slab are processed. Only intersections with x_lo <= x < x_hi are
+    kept: every point is owned by exactly one slab.
+    """
+    gids = [r[0] for r in rows]
+    segs = SegmentStore.from_rows(r[1:] for r in rows)
+    start, stop = x_lo - pad, x_hi + pad
+    events: List[Event] = []
+    for i in range(len(segs)):
+        lx, ly, rx, ry = segs.x1[i], segs.y1[i], segs.x2[i], segs.y2[i]
+        if lx < start:
+            lx, ly = start, segs.y_at(i, start)
+        if rx > stop:
+            rx, ry = stop, segs.y_at(i, stop)
+        events.append(Event(lx, ly, 'L', (i, None)))
+        events.append(Event(rx, ry, 'R', (i, None)))
+    queue = EventQueue(events)
+
+    if polygon_n is None:
+        sweep = SweepLine(segs, log_fn=None)
+    else:
+        sweep = _SlabPolygonSweep(segs, gids, polygon_n)
+    processed = 0
+    while queue:
+        processed += 1
+        for new_ev in sweep.process_event(queue.pop()):
+            if new_ev.x <= stop:
+                queue.push(new_ev)
+
+    hits: List[Hit] = []
+    for (x, y), pairs in sweep.intersections.items():
+        if x_lo <= x < x_hi:
+            for i, j in pairs:
+                hits.append((x, y, gids[i], gids[j]))
+    return hits, processed
+
+def _split(segs: SegmentStore, bounds: List[float], pad: float) -> List[List[SegRow]]:
+    """Assigns each segment to every slab its padded x-range touches."""
+    parts: List[List[SegRow]] = [[] for _ in range(len(bounds) + 1)]
+    for i in range(len(segs)):
+        lo, hi = segs.x1[i], segs.x2[i]
+        (ax, ay), (bx, by) = segs.endpoints(i)
+        row = (i, ax, ay, bx, by)
+        for k in range(bisect_right(bounds, lo - pad), bisect_left(bounds, hi + pad) + 1):
+            parts[k].append(row)
+    return parts
+
+def _run(segs: SegmentStore, slabs: Optional[int], workers: Optional[int],
+         polygon_n: Optional[int]) -> SweepResult:
+    t0 = time.perf_counter()
+    workers = workers or os.cpu_count() or 1
+    slabs = slabs or workers
+    if not len(segs):
+        return SweepResult([], [], SweepStats(0, 0, 0, 0, 0, 0.0))
+    pad = (max(segs.x2) - min(segs.x1)) * 1e-9 + 10 * EPS
+    bounds = slab_bounds(segs, slabs)
+    parts = _split(segs, bounds, pad)
+    edges = [float("-inf")] + bounds + [float("inf")]
+    jobs = [(parts[k], edges[k], edges[k+1], pad, polygon_n) for k in range(len(parts))]
+
+    if workers == 1 or len(jobs) == 1:
+        outputs = [_sweep_slab(*job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            outputs = list(pool.map(_sweep_slab, *zip(*jobs)))
+
+    points = IntersectionSet()
+    events = hits = 0
+    for slab_hits, processed in outputs:    # slabs in x order, each in sweep order
+        events += processed
+        hits += len(slab_hits)
+        for x, y, i, j in slab_hits:
+            points.add(x, y, (i, j))
+    stats = SweepStats(len(segs), events, hits, 0, 0, time.perf_counter() - t0,
+                       len(points))
+    return SweepResult(points.points, points.pairs, stats)
+
+def parallel_find_intersections(segments: Sequence, *, slabs: Optional[int] = None,
+                                workers: Optional[int] = None) -> SweepResult:
+    """
+    find_intersections split into vertical slabs swept in parallel.
+
+    Segments crossing a slab border are sent to every slab they touch;
+    each intersection is reported only by the slab owning its x.
+    """
+    return _run(as_segments(segments), slabs, workers, None)
+
+def parallel_check_polygon(vertices: List[Point], *, slabs: Optional[int] = None,
+                           workers: Optional[int] = None) -> List[Point]:
+    """check_polygon over vertical slabs, with adjacency tested on global edge ids."""
+    n = len(vertices)
+    if n < 3:
+        return []
+    segs = SegmentStore()
+    for i in range(n):
+        segs.append(vertices[i], vertices[(i + 1) % n])
+    return _run(segs, slabs, workers, n).points
@@ -2,12 +2,16 @@
 ## Date: Oct 29, 2025
 ## polygon_checker.py - Polygon self-intersection detection logic
 
-from typing import List, Optional, Tuple
-from bisect import insort
+from bisect import bisect_right
+from typing import List, Optional, Union
 
-from geometry import Point, segment_intersection, EPS
-from segment import Segment, Event
+from geometry import Point
+from segment import Segment, SegmentStore, Event
 from sweep_line import SweepLine
+from event_queue import EventQueue
+from engine import run_sweep, run_sweep_into, first_intersection_sweep, Witness, SweepStats
+from sweep_trace import TRACE_DEBUG
+from sweep_metrics import SweepMetrics
 
 class PolygonSweep(SweepLine):
     """
@@ -15,115 +19,134 @@ class PolygonSweep(SweepLine):
     
     It ignores intersections between adjacent polygon edges.
     """
-    def __init__(self, segments: List[Segment], log_fn=print):
-        super().__init__(segments, log_fn)
+    def __init__(self, segments: Union[SegmentStore, List[Segment]], log_fn=print, status: str = "skiplist",
+                 trace_level: int = TRACE_DEBUG, predicates: str = "eps",
+                 metrics: Optional[SweepMetrics] = None):
+        super().__init__(segments, log_fn, status, trace_level, predicates, metrics)
         self.n = len(segments)
-        self.non_adjacent_intersections: List[Point] = []
+
+    @property
+    def non_adjacent_intersections(self) -> List[Point]:
+        # only non-adjacent pairs are ever added to self.intersections
+        return self.intersections.points
 
     def _are_adjacent(self, s1_id: int, s2_id: int) -> bool:
         """Checks if two segment IDs correspond to adjacent polygon edges."""
         diff = abs(s1_id - s2_id)
         return diff == 1 or diff == (self.n - 1)
 
-    def _process_intersection(self, ev: Event) -> List[Event]:
+    def _reportable(self, s1: int, s2: int) -> bool:
+        return not self._are_adjacent(s1, s2)
+
+    def _report_intersection(self, ev: Event, s1: int, s2: int):
         """
-        Overrides the base method to check for non-adjacent intersections.
+        Overrides the base method to record only non-adjacent intersections.
         """
-        s1, s2 = ev.seg_ids
-        if s1 is None or s2 is None: 
-            return []
-
-        if not self._are_adjacent(s1, s2):
-            is_new = self._add_intersection(ev.x, ev.y)
-            if is_new:
-                self.log(f"FOUND SELF-INTERSECTION at ({ev.x:.2f}) between S{s1} and S{s2}")
-                self.non_adjacent_intersections.append((ev.x, ev.y))
-
-        # The rest of this method is identical to the base class,
-        # required to perform the swap and find new neighbor intersections.
-        try:
-            i1 = self.status_order.index(s1)
-            i2 = self.status_order.index(s2)
-        except ValueError:
-            self.log(f"Warning: S{s1} or S{s2} not in status for intersection.")
-            return []
-            
-        if i1 < i2:
-            i1, i2 = i2, i1
-            s1, s2 = s2, s1
-            
-        self.swap(s1, s2)
-        
-        s1_below = self.status_order[i2 - 1] if i2 > 0 else None
-        s2_above = self.status_order[i1 + 1] if i1 + 1 < len(self.status_order) else None
+        if self._reportable(s1, s2):
+            is_new = self._add_intersection(ev.x, ev.y, (s1, s2))
+            if is_new and self.trace.info:
+                self.trace.emit("FOUND SELF-INTERSECTION at ({:.2f}) between S{} and S{}", ev.x, s1, s2)
 
-        new_events: List[Event] = []
-        
-        if s1_below is not None:
-            r = segment_intersection(self.segments[s1].a, self.segments[s1].b,
-                                     self.segments[s1_below].a, self.segments[s1_below].b)
-            if r: 
-                self.log(f"Found new intersection: S{s1} and S{s1_below}")
-                new_events.append(Event(r[0], r[1], 'I', (s1_below, s1)))
-
-        if s2_above is not None:
-            r = segment_intersection(self.segments[s2].a, self.segments[s2].b,
-                                     self.segments[s2_above].a, self.segments[s2_above].b)
-            if r:
-                self.log(f"Found new intersection: S{s2} and S{s2_above}")
-                new_events.append(Event(r[0], r[1], 'I', (s2, s2_above)))
-            
-        return new_events
-
-def check_polygon(vertices: List[Point], log_fn=print) -> List[Point]:
+class RingSweep(PolygonSweep):
+    """
+    PolygonSweep for polygons with several rings (outer boundary and
+    holes). Edges of all rings are swept together; adjacency is only
+    possible between consecutive edges of the same ring.
+    """
+    def __init__(self, segments: SegmentStore, ring_offsets: List[int], **kw):
+        super().__init__(segments, **kw)
+        self.ring_offsets = ring_offsets    # first edge id of each ring, plus the total
+
+    def _are_adjacent(self, s1_id: int, s2_id: int) -> bool:
+        r = bisect_right(self.ring_offsets, s1_id) - 1
+        start, end = self.ring_offsets[r], self.ring_offsets[r+1]
+        if not start <= s2_id < end:
+            return False
+        diff = abs(s1_id - s2_id)
+        return diff == 1 or diff == (end - start - 1)
+
+def check_polygon(vertices: List[Point], log_fn=print, status: str = "skiplist",
+                  trace_level: int = TRACE_DEBUG, predicates: str = "eps",
+                  cancel=None, progress_fn=None) -> List[Point]:
     """
     Runs the full sweep-line algorithm to find ALL self-intersections.
     
     Returns a list of all non-adjacent intersection points found.
+    `status` selects the sweep status structure (see status.STATUS_TYPES),
+    `predicates` the intersection test (see geometry.PREDICATES).
+    `cancel` and `progress_fn` are passed to engine.run_sweep.
     """
     if len(vertices) < 3:
         return []
         
-    segments: List[Segment] = []
-    event_queue: List[Event] = []
+    segments = SegmentStore()
     n = len(vertices)
     
     for i in range(n):
-        p1 = vertices[i]
-        p2 = vertices[(i + 1) % n]
-        
-        left_pt, right_pt = (p1, p2) if p1[0] < p2[0] else (p2, p1)
-        
-        seg = Segment(id=i, a=p1, b=p2, color="#000000") 
-        segments.append(seg)
-        
-        event_queue.append(Event(left_pt[0], left_pt[1], 'L', (seg.id, None)))
-        event_queue.append(Event(right_pt[0], right_pt[1], 'R', (seg.id, None)))
+        segments.append(vertices[i], vertices[(i + 1) % n])
 
-    event_queue.sort()
-    
-    sweep = PolygonSweep(segments, log_fn=log_fn)
+    sweep = PolygonSweep(segments, log_fn=log_fn, status=status, trace_level=trace_level,
+                         predicates=predicates)
+    run_sweep(sweep, EventQueue.from_segments(segments), cancel, progress_fn)
 
-    while event_queue:
-        ev = event_queue.pop(0)
-        new_events = sweep.process_event(ev)
-        
-        if new_events:
-            for new_ev in new_events:
-                if new_ev.x < sweep.sweep_x - EPS:
-                    continue
-                    
-                is_duplicate = False
-                for existing_ev in event_queue:
-                    if existing_ev.type == 'I' and \
-                       abs(existing_ev.x - new_ev.x) < EPS and \
-                       abs(existing_ev.y - new_ev.y) < EPS and \
-                       set(existing_ev.seg_ids) == set(new_ev.seg_ids):
-                        is_duplicate = True
-                        break
-                
-                if not is_duplicate:
-                    log_fn(f"SCHEDULING new: {new_ev.type} at ({new_ev.x:.2f}, {new_ev.y:.2f})")
-                    insort(event_queue, new_ev)
+    return sweep.non_adjacent_intersections
+
+def check_polygon_into(vertices: List[Point], sink, status: str = "skiplist",
+                       predicates: str = "eps") -> SweepStats:
+    """
+    check_polygon writing each non-adjacent (point, pair) to `sink` (see
+    sinks.py) instead of keeping the points.
+    """
+    segments = SegmentStore()
+    n = len(vertices)
+    if n >= 3:
+        for i in range(n):
+            segments.append(vertices[i], vertices[(i + 1) % n])
+    sweep = PolygonSweep(segments, log_fn=None, status=status, predicates=predicates)
+    return run_sweep_into(sweep, EventQueue.from_segments(segments), sink)
+
+def check_rings(rings: List[List[Point]], log_fn=None, status: str = "skiplist",
+                trace_level: int = TRACE_DEBUG, predicates: str = "eps") -> List[Point]:
+    """
+    check_polygon for a polygon given as several rings (e.g. an outer
+    boundary and its holes): reports crossings within a ring and between
+    rings. Rings with fewer than 3 vertices are ignored.
+    """
+    segments = SegmentStore()
+    offsets = [0]
+    for ring in rings:
+        n = len(ring)
+        if n < 3:
+            continue
+        for i in range(n):
+            segments.append(ring[i], ring[(i + 1) % n])
+        offsets.append(len(segments))
+    if len(segments) == 0:
+        return []
+
+    sweep = RingSweep(segments, offsets, log_fn=log_fn, status=status,
+                      trace_level=trace_level, predicates=predicates)
+    run_sweep(sweep, EventQueue.from_segments(segments))
 
     return sweep.non_adjacent_intersections
+
+def find_self_intersection(vertices: List[Point], status: str = "skiplist",
+                           predicates: str = "eps") -> Optional[Witness]:
+    """
+    Early-exit check: the first non-adjacent edge crossing found, as a
+    Witness((i, j), point) where edge i runs from vertices[i] to
+    vertices[i+1], or None if the polygon is simple. O(n log n); see
+    engine.first_intersection_sweep.
+    """
+    if len(vertices) < 3:
+        return None
+    segments = SegmentStore()
+    n = len(vertices)
+    for i in range(n):
+        segments.append(vertices[i], vertices[(i + 1) % n])
+    sweep = PolygonSweep(segments, log_fn=None, status=status, predicates=predicates)
+    return first_intersection_sweep(sweep)
+
+def is_simple_polygon(vertices: List[Point], status: str = "skiplist",
+                      predicates: str = "eps") -> bool:
+    return find_self_intersection(vertices, status, predicates) is None
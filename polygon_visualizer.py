@@ -2,11 +2,44 @@
 ## Date: Oct 29, 2025
 ## polygon_visualizer.py - GUI for polygon self-intersection
 
+import queue
+import threading
 import tkinter as tk
+from collections import deque
 from tkinter import ttk
 from typing import List
 from geometry import Point
 import polygon_checker
+from engine import SweepCancelled
+from sweep_trace import TRACE_INFO
+from incremental_checker import IncrementalPolygonChecker
+
+LOG_MAX_LINES = 2000    # the log box keeps only the newest lines
+POLL_MS = 50            # how often the GUI drains a running check's output
+
+class CheckJob:
+    """
+    One background check_polygon run and the channels it reports through.
+    It logs at TRACE_INFO (crossings and warnings): the per-event debug
+    lines would only be dropped by the ring buffer and cost most of the run.
+    """
+    def __init__(self, vertices: List[Point]):
+        self.vertices = vertices
+        self.cancel = threading.Event()
+        self.results: "queue.Queue" = queue.Queue()     # ("progress", f) / ("done", points) / ...
+        self.log_lines = deque(maxlen=LOG_MAX_LINES)    # ring buffer: old lines drop off
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def run(self):
+        try:
+            points = polygon_checker.check_polygon(
+                self.vertices, log_fn=self.log_lines.append, trace_level=TRACE_INFO,
+                cancel=self.cancel, progress_fn=lambda f: self.results.put(("progress", f)))
+            self.results.put(("done", points))
+        except SweepCancelled:
+            self.results.put(("cancelled", None))
+        except Exception as e:
+            self.results.put(("error", e))
 
 class PolygonVisualizer:
     def __init__(self, master):
@@ -30,17 +63,40 @@ class PolygonVisualizer:
         self.btn_clear = ttk.Button(self.right, text="Clear", command=self.clear_canvas)
         self.btn_clear.pack()
 
+        self.btn_cancel = ttk.Button(self.right, text="Cancel", command=self.cancel_check,
+                                     state=tk.DISABLED)
+        self.btn_cancel.pack(pady=4)
+        self.progress = ttk.Progressbar(self.right, maximum=1.0, length=200, mode="determinate")
+        self.progress.pack(pady=4)
+
+        self.live_var = tk.StringVar(value="Live check: -")
+        ttk.Label(self.right, textvariable=self.live_var, wraplength=250).pack(anchor='w')
+
         self.log_box = tk.Text(self.right, height=25, width=40)
         self.log_box.pack(pady=10)
 
         self.vertices: List[Point] = []
         self.canvas_items = []
+        self.checker = IncrementalPolygonChecker()
+        self.job = None         # running CheckJob
+        self.log_count = 0
         
         self.canvas.bind("<Button-1>", self.add_point)
         self.log("Ready. Click to draw polygon vertices.")
 
     def log(self, msg: str):
-        self.log_box.insert("1.0", msg + "\n")
+        self.log_many([msg])
+
+    def log_many(self, lines: List[str]):
+        """Inserts lines (oldest first) at the top in one call and trims the box."""
+        if not lines:
+            return
+        lines = lines[-LOG_MAX_LINES:]
+        self.log_box.insert("1.0", "\n".join(reversed(lines)) + "\n")
+        self.log_count += len(lines)
+        if self.log_count > LOG_MAX_LINES:
+            self.log_box.delete(f"{LOG_MAX_LINES + 1}.0", tk.END)
+            self.log_count = LOG_MAX_LINES
 
     def add_point(self, event):
         x, y = float(event.x), float(event.y)
@@ -56,18 +112,47 @@ class PolygonVisualizer:
             self.canvas_items.append(e_id)
         
         self.log(f"Added vertex {len(self.vertices)} at ({x:.0f}, {y:.0f})")
+        self.checker.add_vertex((x, y))
+        self.show_live_check()
+
+    def show_live_check(self):
+        """Redraws the closing-edge preview and the incremental checker's hits."""
+        self.canvas.delete("live")
+        if len(self.vertices) < 3:
+            self.live_var.set("Live check: -")
+            return
+        p_last, p_first = self.vertices[-1], self.vertices[0]
+        self.canvas.create_line(p_last[0], p_last[1], p_first[0], p_first[1],
+                                fill="gray", dash=(4, 3), tags="live")
+        points = self.checker.intersections()
+        for (x, y) in points:
+            self.canvas.create_oval(x-4, y-4, x+4, y+4, outline="orange", width=2, tags="live")
+        if points:
+            self.live_var.set(f"Live check: {len(points)} self-intersection(s)")
+        else:
+            self.live_var.set("Live check: simple")
 
     def clear_canvas(self):
+        if self.job:
+            self.job.cancel.set()   # its results are ignored from now on
+            self.end_job()
         for item_id in self.canvas_items:
             self.canvas.delete(item_id)
         self.canvas.delete("intersection")
+        self.canvas.delete("live")
             
         self.vertices = []
         self.canvas_items = []
+        self.checker.clear()
+        self.live_var.set("Live check: -")
         self.log_box.delete("1.0", tk.END)
+        self.log_count = 0
+        self.progress["value"] = 0
         self.log("Cleared canvas. Ready to draw new polygon.")
 
     def check_polygon(self):
+        if self.job:
+            return
         if len(self.vertices) < 3:
             self.log("Error: A polygon needs at least 3 vertices.")
             return
@@ -76,24 +161,67 @@ class PolygonVisualizer:
         p_first = self.vertices[0]
         e_id = self.canvas.create_line(p_last[0], p_last[1], p_first[0], p_first[1], fill="blue", width=2)
         self.canvas_items.append(e_id)
+        self.canvas.delete("live")
         
         self.log(f"Checking {len(self.vertices)}-sided polygon...")
         self.canvas.unbind("<Button-1>")
 
-        intersection_points = polygon_checker.check_polygon(self.vertices, log_fn=self.log)
-        
+        # the sweep runs on a worker thread; poll_job drains its output
+        self.job = CheckJob(list(self.vertices))
+        self.btn_check.configure(state=tk.DISABLED)
+        self.btn_cancel.configure(state=tk.NORMAL)
+        self.progress["value"] = 0
+        self.job.thread.start()
+        self.master.after(POLL_MS, self.poll_job, self.job)
+
+    def cancel_check(self):
+        if self.job:
+            self.job.cancel.set()
+            self.log("Cancelling...")
+
+    def poll_job(self, job: CheckJob):
+        if job is not self.job:
+            return      # cleared while running
+        # take only what is there now: the worker keeps appending meanwhile
+        lines = [job.log_lines.popleft() for _ in range(len(job.log_lines))]
+        self.log_many(lines)
+        while True:
+            try:
+                kind, value = job.results.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "progress":
+                self.progress["value"] = value
+                continue
+            self.end_job()
+            if kind == "done":
+                self.progress["value"] = 1.0
+                self.show_result(value)
+            elif kind == "cancelled":
+                self.log("--- Check cancelled ---")
+            else:
+                self.log(f"Error: {value!r}")
+            return
+        self.master.after(POLL_MS, self.poll_job, job)
+
+    def end_job(self):
+        self.job = None
+        self.btn_check.configure(state=tk.NORMAL)
+        self.btn_cancel.configure(state=tk.DISABLED)
+        self.canvas.bind("<Button-1>", self.add_point)
+
+    def show_result(self, intersection_points: List[Point]):
         if intersection_points:
-            self.log(f"--- POLYGON IS SELF-INTERSECTING ---")
-            self.log(f"Found {len(intersection_points)} non-adjacent intersection(s):")
+            lines = ["--- POLYGON IS SELF-INTERSECTING ---",
+                     f"Found {len(intersection_points)} non-adjacent intersection(s):"]
             
             for i, (x, y) in enumerate(intersection_points):
-                self.log(f"  {i+1}. at ({x:.2f}, {y:.2f})")
+                lines.append(f"  {i+1}. at ({x:.2f}, {y:.2f})")
                 
                 self.canvas.create_oval(x-6, y-6, x+6, y+6, 
                                         outline="red", fill="red", tags="intersection")
                 self.canvas.create_text(x, y-10, text=f"{i+1}", 
                                         fill="red", tags="intersection", font=("Arial", 10, "bold"))
+            self.log_many(lines)
         else:
             self.log(f"--- Polygon is SIMPLE (not self-intersecting) ---")
-            
-        self.canvas.bind("<Button-1>", self.add_point)
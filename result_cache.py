@@ -0,0 +1,175 @@
+## GroupID-20 (22114029_22113078) - Dhruv, Komal
+## Date: Nov 6, 2025
+## result_cache.py - Content-addressed cache of polygon checks and sweeps
+
+import hashlib
+import pickle
+import sqlite3
+import struct
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from geometry import Point, EPS
+from engine import SweepResult, as_segments, find_intersections
+from sweep_trace import TRACE_OFF
+import polygon_checker
+
+# bump whenever a change to the engine can change results: every key
+# includes it (with EPS and the predicates), so older entries just miss
+ENGINE_VERSION = 2
+
+# find_intersections options that change its result (the method, and the
+# trace level through the "auto" choice, change the points' order and the
+# stats), with their defaults so omitting one keys like passing it
+FIND_OPTIONS = {"method": "auto", "status": None, "trace_level": TRACE_OFF}
+
+def _digest(kind: str, predicates: str, floats: Sequence[float], options: str = "") -> str:
+    h = hashlib.sha256(f"{kind}|{ENGINE_VERSION}|{EPS!r}|{predicates}|{options}|".encode())
+    # + 0.0 turns -0.0 into 0.0, which compares equal but packs differently
+    h.update(struct.pack(f"<{len(floats)}d", *(v + 0.0 for v in floats)))
+    return h.hexdigest()
+
+def canonical_ring(vertices: Sequence[Point]) -> List[Point]:
+    """
+    The same ring for every rotation and both directions of `vertices`:
+    the lexicographically smallest sequence starting at a smallest vertex.
+    """
+    n = len(vertices)
+    if n == 0:
+        return []
+    vs = [tuple(v) for v in vertices]
+    low = min(vs)
+    best = None
+    for i in range(n):
+        if vs[i] != low:
+            continue
+        fwd = [vs[(i + k) % n] for k in range(n)]
+        back = [vs[(i - k) % n] for k in range(n)]
+        for cand in (fwd, back):
+            if best is None or cand < best:
+                best = cand
+    return best
+
+def polygon_key(vertices: Sequence[Point], predicates: str = "eps") -> str:
+    return _digest("polygon", predicates, [c for v in canonical_ring(vertices) for c in v])
+
+def segments_key(segments: Sequence, predicates: str = "eps",
+                 options: str = "") -> Tuple[str, List[int]]:
+    """
+    Key invariant to the order of the segments and of their endpoints,
+    and `order`, where order[k] is the input id of the k-th canonical one.
+    `options` is folded into the key as is.
+    """
+    store = as_segments(segments)
+    rows = []
+    for i in range(len(store)):
+        a, b = store.endpoints(i)
+        rows.append((a + b) if a <= b else (b + a))
+    order = sorted(range(len(rows)), key=rows.__getitem__)
+    return _digest("segments", predicates, [c for k in order for c in rows[k]], options), order
+
+class ResultCache:
+    """
+    Caches check_polygon and find_intersections results by a canonical
+    hash of the input, so resubmitted geometry costs a hash, not a sweep.
+
+    An in-memory LRU tier holds up to `max_entries` results; with `path`
+    they are also written to a sqlite file, which survives restarts and
+    can be shared by workers. `stats` counts hits per tier and misses.
+    """
+    def __init__(self, max_entries: int = 1024, path: Optional[str] = None):
+        self.max_entries = max_entries
+        self.memory: "OrderedDict[str, object]" = OrderedDict()
+        self.stats: Dict[str, int] = {"hits": 0, "disk_hits": 0, "misses": 0}
+        self.db = None
+        if path is not None:
+            self.db = sqlite3.connect(path)
+            self.db.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value BLOB)")
+            self.db.commit()
+
+    def __len__(self) -> int:
+        return len(self.memory)
+
+    def close(self):
+        if self.db is not None:
+            self.db.close()
+            self.db = None
+
+    def get(self, key: str):
+        """The cached value for key, or None."""
+        if key in self.memory:
+            self.memory.move_to_end(key)
+            self.stats["hits"] += 1
+            return self.memory[key]
+        if self.db is not None:
+            row = self.db.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                self.stats["disk_hits"] += 1
+                value = pickle.loads(row[0])
+                self._remember(key, value)
+                return value
+        self.stats["misses"] += 1
+        return None
+
+    def put(self, key: str, value):
+        self._remember(key, value)
+        if self.db is not None:
+            self.db.execute("INSERT OR REPLACE INTO results VALUES (?, ?)",
+                            (key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)))
+            self.db.commit()
+
+    def _remember(self, key: str, value):
+        self.memory[key] = value
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.max_entries:
+            self.memory.popitem(last=False)
+
+    def clear(self):
+        self.memory.clear()
+        if self.db is not None:
+            self.db.execute("DELETE FROM results")
+            self.db.commit()
+
+    # --- cached entry points ---
+
+    def check_polygon(self, vertices: List[Point], predicates: str = "eps",
+                      status: str = "skiplist") -> List[Point]:
+        """polygon_checker.check_polygon (without logging), cached."""
+        key = polygon_key(vertices, predicates)
+        points = self.get(key)
+        if points is None:
+            points = polygon_checker.check_polygon(vertices, log_fn=None, status=status,
+                                                   predicates=predicates)
+            self.put(key, list(points))
+        return list(points)
+
+    def find_intersections(self, segments: Sequence, predicates: str = "eps",
+                           **kw) -> SweepResult:
+        """
+        engine.find_intersections, cached. The key includes the
+        FIND_OPTIONS in kw; log_fn is ignored, and a call passing
+        `metrics` to fill always runs. On a hit the pairs are mapped to
+        this input's segment ids; stats are those of the run that filled
+        the entry.
+        """
+        kw.pop("log_fn", None)
+        if kw.get("metrics") is not None:
+            return find_intersections(segments, predicates=predicates, log_fn=None, **kw)
+        kw.pop("metrics", None)
+        options = dict(FIND_OPTIONS, **kw)
+        store = as_segments(segments)
+        key, order = segments_key(store, predicates, repr(sorted(options.items())))
+        entry = self.get(key)
+        if entry is None:
+            result = find_intersections(store, predicates=predicates, log_fn=None, **kw)
+            canonical = [0] * len(order)
+            for k, i in enumerate(order):
+                canonical[i] = k
+            pairs = [[(canonical[i], canonical[j]) for i, j in at_point]
+                     for at_point in result.pairs]
+            self.put(key, (result.points, pairs, result.stats))
+            return result
+        points, pairs, stats = entry
+        remapped = [[(order[i], order[j]) if order[i] < order[j] else (order[j], order[i])
+                     for i, j in at_point] for at_point in pairs]
+        return SweepResult(list(points), remapped, stats)
@@ -2,8 +2,15 @@
 ## Date: Oct 28, 2025
 ## segment.py - Data structures for segments and events
 
-from typing import NamedTuple, Tuple, Optional
-from geometry import Point
+from array import array
+from itertools import compress
+from typing import Iterable, Iterator, NamedTuple, Tuple, Optional
+from geometry import Point, EPS
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 class Segment(NamedTuple):
     id: int
@@ -16,3 +23,126 @@ class Event(NamedTuple):
     y: float
     type: str                  # 'L', 'R', 'I'
     seg_ids: Tuple[int, Optional[int]]
+
+# Packed event: (x, y, code, s1, s2) with s2 = -1 when absent. Codes sort
+# like the type letters ('I' < 'L' < 'R'), so packed tuples keep Event order.
+PackedEvent = Tuple[float, float, int, int, int]
+EVENT_CODES = {'I': 0, 'L': 1, 'R': 2}
+EVENT_TYPES = 'ILR'
+
+def pack_event(ev: Event) -> PackedEvent:
+    s1, s2 = ev.seg_ids
+    return (ev.x, ev.y, EVENT_CODES[ev.type], s1, -1 if s2 is None else s2)
+
+def unpack_event(p: PackedEvent) -> Event:
+    x, y, code, s1, s2 = p
+    return Event(x, y, EVENT_TYPES[code], (s1, None if s2 < 0 else s2))
+
+class SegmentStore:
+    """
+    Struct-of-arrays segment storage for the sweep engine.
+
+    Coordinates live in contiguous float64 columns ordered left endpoint
+    first (x1 <= x2), with the slope precomputed for y_at; `flipped` records
+    which endpoint was `a` so the original orientation can be rebuilt.
+    y_at uses y1 + slope*(x - x1): the left endpoint is the intercept
+    anchor, since a global intercept loses precision far from the origin.
+    Display data such as colours is not kept here.
+    """
+    def __init__(self):
+        self.x1, self.y1 = array('d'), array('d')
+        self.x2, self.y2 = array('d'), array('d')
+        self.slope = array('d')
+        self.flipped = array('b')
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Tuple[float, float, float, float]]) -> "SegmentStore":
+        """Builds a store from (ax, ay, bx, by) rows; ids are row positions."""
+        store = cls()
+        for ax, ay, bx, by in rows:
+            store.append((ax, ay), (bx, by))
+        return store
+
+    @classmethod
+    def from_segments(cls, segments: Iterable) -> "SegmentStore":
+        if isinstance(segments, SegmentStore):
+            return segments
+        if hasattr(segments, "array"):    # segment_io.MappedSegments
+            return cls.from_array(segments.array)
+        return cls.from_rows((s.a[0], s.a[1], s.b[0], s.b[1]) for s in segments)
+
+    @classmethod
+    def from_array(cls, data) -> "SegmentStore":
+        """
+        Builds a store from packed (ax, ay, bx, by) rows in bulk: an (n, 4)
+        NumPy array (e.g. a memmap) or a flat float64 memoryview. The
+        columns are filled from slices instead of row by row, with the
+        same left/right rule as append.
+        """
+        store = cls()
+        if np is not None and isinstance(data, np.ndarray):
+            a = np.asarray(data, dtype=np.float64).reshape(-1, 4)
+            ax, ay, bx, by = a[:, 0], a[:, 1], a[:, 2], a[:, 3]
+            flipped = (bx < ax) | ((bx == ax) & (by < ay))
+            lx, ly = np.where(flipped, bx, ax), np.where(flipped, by, ay)
+            rx, ry = np.where(flipped, ax, bx), np.where(flipped, ay, by)
+            dx = rx - lx
+            slope = np.zeros_like(dx)
+            np.divide(ry - ly, dx, out=slope, where=dx >= EPS)
+            for col, values in ((store.x1, lx), (store.y1, ly), (store.x2, rx),
+                                (store.y2, ry), (store.slope, slope)):
+                col.frombytes(values.tobytes())
+            store.flipped.frombytes(flipped.astype(np.int8).tobytes())
+            return store
+        x1, y1, x2, y2 = (array('d', data[k::4].tobytes()) for k in range(4))
+        flipped = array('b', [(bx, by) < (ax, ay) for ax, ay, bx, by in zip(x1, y1, x2, y2)])
+        for i in compress(range(len(flipped)), flipped):
+            x1[i], x2[i] = x2[i], x1[i]
+            y1[i], y2[i] = y2[i], y1[i]
+        store.x1, store.y1, store.x2, store.y2, store.flipped = x1, y1, x2, y2, flipped
+        store.slope = array('d', [(ry-ly)/(rx-lx) if rx-lx >= EPS else 0.0
+                                  for lx, ly, rx, ry in zip(x1, y1, x2, y2)])
+        return store
+
+    def append(self, a: Point, b: Point) -> int:
+        # the left end is the smaller (x, y): a vertical segment runs bottom
+        # to top, so its 'L' event sorts before its 'R' event
+        flipped = (b[0], b[1]) < (a[0], a[1])
+        (lx, ly), (rx, ry) = (b, a) if flipped else (a, b)
+        self.x1.append(lx); self.y1.append(ly)
+        self.x2.append(rx); self.y2.append(ry)
+        self.slope.append((ry-ly)/(rx-lx) if rx-lx >= EPS else 0.0)
+        self.flipped.append(flipped)
+        return len(self.x1) - 1
+
+    def __len__(self) -> int:
+        return len(self.x1)
+
+    def endpoints(self, i: int) -> Tuple[Point, Point]:
+        """(a, b) in the segment's original orientation."""
+        l, r = (self.x1[i], self.y1[i]), (self.x2[i], self.y2[i])
+        return (r, l) if self.flipped[i] else (l, r)
+
+    def __getitem__(self, i: int) -> Segment:
+        if i < 0:
+            i += len(self)
+        a, b = self.endpoints(i)
+        return Segment(i, a, b, "")
+
+    def __iter__(self) -> Iterator[Segment]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def y_at(self, i: int, x: float) -> float:
+        if self.x2[i] - self.x1[i] < EPS:
+            return min(self.y1[i], self.y2[i])
+        return self.y1[i] + self.slope[i]*(x - self.x1[i])
+
+    def packed_endpoint_events(self) -> Iterator[PackedEvent]:
+        for i in range(len(self)):
+            yield (self.x1[i], self.y1[i], 1, i, -1)
+            yield (self.x2[i], self.y2[i], 2, i, -1)
+
+    def nbytes(self) -> int:
+        return sum(col.itemsize * len(col) for col in
+                   (self.x1, self.y1, self.x2, self.y2, self.slope, self.flipped))
@@ -0,0 +1,152 @@
+## GroupID-20 (22114029_22113078) - Dhruv, Komal
+## Date: Nov 5, 2025
+## segment_index.py - Build-once spatial index for repeated segment queries
+
+import math
+import pickle
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from geometry import Point, segment_intersection
+from segment import SegmentStore
+from grid_index import MAX_SEGMENT_CELLS, UniformGrid
+from engine import as_segments
+import vectorized
+from vectorized import HAVE_NUMPY, VECTOR_BATCH_MIN
+
+# bumped whenever the pickled layout changes; older files are refused
+INDEX_VERSION = 2
+
+Box = Tuple[float, float, float, float]
+Hit = Tuple[int, Point]
+
+class SegmentIndex:
+    """
+    Static segment set indexed on a UniformGrid, for answering many
+    queries against the same segments without re-sweeping.
+
+    crossing(a, b) returns the indexed segments that a-b intersects, with
+    the point, exactly as geometry.segment_intersection would; window()
+    returns the segments meeting a rectangle. The *_many variants answer a
+    batch at once, testing all candidate pairs through the NumPy kernel
+    when it is available. save/load pickle the built grid, so a worker
+    starts warm instead of re-indexing. Segments crossing more than
+    `max_cells` cells are checked against every query instead of filed
+    (see UniformGrid); None files everything.
+    """
+    def __init__(self, segments: Sequence, cell: Optional[float] = None,
+                 max_cells: Optional[int] = MAX_SEGMENT_CELLS):
+        self.segments = as_segments(segments)
+        self.cell = cell or self.default_cell(self.segments)
+        self.grid = UniformGrid(self.cell, max_cells)
+        endpoints = self.segments.endpoints
+        for i in range(len(self.segments)):
+            self.grid.insert(i, *endpoints(i))
+        self._array = None
+
+    @staticmethod
+    def default_cell(segs: SegmentStore) -> float:
+        """
+        The median segment length, clamped to the side of area / n: the
+        grid follows typical local density, and a few long segments (or
+        many, as in a grid of lines) cannot collapse it to a few cells.
+        """
+        n = len(segs)
+        if not n:
+            return 1.0
+        lengths = sorted(math.hypot(segs.x2[i] - segs.x1[i], segs.y2[i] - segs.y1[i])
+                         for i in range(n))
+        median = lengths[n // 2]
+        width = max(segs.x2) - min(segs.x1)
+        height = max(max(segs.y1), max(segs.y2)) - min(min(segs.y1), min(segs.y2))
+        # all on one line: spread the extent over n cells instead
+        side = math.sqrt(width * height / n) if width * height > 0 else max(width, height) / n
+        return max(min(median, side) if median > 0 else side, 1e-6)
+
+    def __len__(self) -> int:
+        return len(self.segments)
+
+    # --- queries ---
+
+    def crossing(self, a: Point, b: Point) -> List[Hit]:
+        """(segment id, point) for every indexed segment a-b intersects, by id."""
+        endpoints = self.segments.endpoints
+        hits = []
+        for j in self.grid.candidates(a, b):
+            r = segment_intersection(a, b, *endpoints(j))
+            if r:
+                hits.append((j, r))
+        hits.sort()
+        return hits
+
+    def crossing_many(self, queries: Iterable) -> List[List[Hit]]:
+        """crossing() for each query segment (Segments, 4-tuples or point pairs)."""
+        q = as_segments(queries)
+        qi, cj = [], []
+        for i in range(len(q)):
+            cands = self.grid.candidates(*q.endpoints(i))
+            qi.extend([i] * len(cands))
+            cj.extend(cands)
+        out: List[List[Hit]] = [[] for _ in range(len(q))]
+        if HAVE_NUMPY and len(qi) >= VECTOR_BATCH_MIN:
+            np = vectorized.np
+            if self._array is None:
+                self._array = vectorized.as_array(self.segments)
+            # queries go after the indexed rows so both can be addressed by row
+            segs = np.vstack([self._array, vectorized.as_array(q)])
+            i = np.array(qi, dtype=np.intp) + len(self.segments)
+            j = np.array(cj, dtype=np.intp)
+            hit, xs, ys = vectorized.intersect_pairs(segs, i, j)
+            for k in np.flatnonzero(hit).tolist():
+                out[qi[k]].append((cj[k], (float(xs[k]), float(ys[k]))))
+        else:
+            endpoints = self.segments.endpoints
+            for i, j in zip(qi, cj):
+                r = segment_intersection(*q.endpoints(i), *endpoints(j))
+                if r:
+                    out[i].append((j, r))
+        for hits in out:
+            hits.sort()
+        return out
+
+    def window(self, xmin: float, ymin: float, xmax: float, ymax: float) -> List[int]:
+        """Ids of the segments with a point inside or on the rectangle."""
+        corners = ((xmin, ymin), (xmax, ymin), (xmax, ymax), (xmin, ymax))
+        sides = [(corners[k], corners[(k + 1) % 4]) for k in range(4)]
+        endpoints = self.segments.endpoints
+        found = []
+        for j in self.grid.query_box(xmin, ymin, xmax, ymax):
+            a, b = endpoints(j)
+            if (xmin <= a[0] <= xmax and ymin <= a[1] <= ymax) or \
+               any(segment_intersection(a, b, p, q) for p, q in sides):
+                found.append(j)
+        found.sort()
+        return found
+
+    def window_many(self, boxes: Iterable[Box]) -> List[List[int]]:
+        return [self.window(*box) for box in boxes]
+
+    # --- persistence ---
+
+    def save(self, path: str):
+        state = {"version": INDEX_VERSION, "cell": self.cell, "segments": self.segments,
+                 "max_cells": self.grid.max_cells, "cells": self.grid.cells,
+                 "key_cells": self.grid.key_cells, "oversize": self.grid.oversize}
+        with open(path, "wb") as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path: str) -> "SegmentIndex":
+        """Loads an index written by save(); the grid is not rebuilt. Only load trusted files."""
+        with open(path, "rb") as f:
+            state = pickle.load(f)
+        if not isinstance(state, dict) or state.get("version") != INDEX_VERSION:
+            raise ValueError(f"{path}: not a version {INDEX_VERSION} segment index")
+        index = cls.__new__(cls)
+        index.segments = state["segments"]
+        index.cell = state["cell"]
+        index.grid = UniformGrid(index.cell, state["max_cells"])
+        index.grid.cells = state["cells"]
+        index.grid.key_cells = state["key_cells"]
+        index.grid.oversize = state["oversize"]
+        index._array = None
+        return index
@@ -0,0 +1,178 @@
+## GroupID-20 (22114029_22113078) - Dhruv, Komal
+## Date: Nov 1, 2025
+## segment_io.py - Streaming segment readers/writers (CSV, WKT, binary)
+
+import csv
+import mmap
+import re
+import struct
+from typing import Iterable, Iterator, List, Tuple
+
+from geometry import Point
+from segment import Segment
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Binary format: 8-byte magic, little-endian uint64 count, then `count`
+# records of four little-endian float64: x1, y1, x2, y2.
+MAGIC = b"BOSEG\x00\x01\x00"
+HEADER = struct.Struct("<8sQ")
+RECORD = struct.Struct("<4d")
+
+def iter_csv(path: str, delimiter: str = ",") -> Iterator[Segment]:
+    """
+    Yields one Segment per `x1,y1,x2,y2` row. Non-numeric rows before the
+    first data row (after any # comments) are taken as a header and
+    skipped; extra columns are ignored.
+    """
+    with open(path, newline="") as f:
+        seg_id = 0
+        reader = csv.reader(f, delimiter=delimiter)
+        for row in reader:
+            if not row or row[0].lstrip().startswith("#"):
+                continue
+            try:
+                x1, y1, x2, y2 = (float(v) for v in row[:4])
+            except ValueError:
+                if seg_id == 0:
+                    continue
+                # line_num counts file lines, so quoted newlines keep it right
+                raise ValueError(f"{path}:{reader.line_num}: expected x1,y1,x2,y2, got {row!r}")
+            yield Segment(seg_id, (x1, y1), (x2, y2), "")
+            seg_id += 1
+
+_COORDS = re.compile(r"\(([^()]*)\)")
+
+def _wkt_paths(text: str) -> Iterator[List[Point]]:
+    for group in _COORDS.findall(text):
+        pts = []
+        for pair in group.split(","):
+            xs = pair.split()
+            if len(xs) >= 2:
+                pts.append((float(xs[0]), float(xs[1])))
+        yield pts
+
+def iter_wkt(path: str) -> Iterator[Segment]:
+    """
+    Yields the edges of every LINESTRING / MULTILINESTRING in a file with
+    one WKT geometry per line, as consecutive Segments.
+    """
+    seg_id = 0
+    with open(path) as f:
+        for line in f:
+            head = line.lstrip()[:20].upper()
+            if not head.startswith(("LINESTRING", "MULTILINESTRING")):
+                continue
+            for pts in _wkt_paths(line):
+                for a, b in zip(pts, pts[1:]):
+                    yield Segment(seg_id, a, b, "")
+                    seg_id += 1
+
+def write_csv(path: str, segments: Iterable[Segment]):
+    with open(path, "w", newline="") as f:
+        w = csv.writer(f)
+        w.writerow(("x1", "y1", "x2", "y2"))
+        for s in segments:
+            w.writerow((repr(s.a[0]), repr(s.a[1]), repr(s.b[0]), repr(s.b[1])))
+
+def write_binary(path: str, segments: Iterable, chunk: int = 65536) -> int:
+    """Streams segments (Segments or 4-tuples) to the binary format; returns the count."""
+    count = 0
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, 0))
+        buf = bytearray()
+        for s in segments:
+            if isinstance(s, Segment):
+                buf += RECORD.pack(s.a[0], s.a[1], s.b[0], s.b[1])
+            else:
+                buf += RECORD.pack(*s)
+            count += 1
+            if count % chunk == 0:
+                f.write(buf)
+                buf.clear()
+        f.write(buf)
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, count))
+    return count
+
+class MappedSegments:
+    """
+    Read-only sequence view of a binary segment file.
+
+    The file is memory-mapped (numpy.memmap when NumPy is available, a
+    plain mmap otherwise) and Segment tuples are only built for the items
+    actually accessed, so opening a file costs O(1) memory.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            magic, count = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC:
+            raise ValueError(f"{path}: not a segment file (bad magic {magic!r})")
+        self.count = count
+        if np is not None:
+            self.array = np.memmap(path, dtype="<f8", mode="r", offset=HEADER.size,
+                                   shape=(count, 4))
+            self._mm = None
+        else:
+            with open(path, "rb") as f:
+                self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self.array = memoryview(self._mm)[HEADER.size:].cast("d")
+
+    def __len__(self) -> int:
+        return self.count
+
+    def row(self, i: int) -> Tuple[float, float, float, float]:
+        if not 0 <= i < self.count:
+            raise IndexError(i)
+        if self._mm is None:
+            x1, y1, x2, y2 = self.array[i].tolist()
+        else:
+            x1, y1, x2, y2 = self.array[4*i:4*i+4]
+        return x1, y1, x2, y2
+
+    def __getitem__(self, i: int) -> Segment:
+        if i < 0:
+            i += self.count
+        x1, y1, x2, y2 = self.row(i)
+        return Segment(i, (x1, y1), (x2, y2), "")
+
+    def __iter__(self) -> Iterator[Segment]:
+        for i in range(self.count):
+            yield self[i]
+
+def read_binary(path: str) -> MappedSegments:
+    return MappedSegments(path)
+
+def open_segments(path: str):
+    """
+    Opens a segment file by extension: .csv and .wkt are streamed as
+    Segment iterators, anything else is mapped as the binary format.
+    """
+    lower = path.lower()
+    if lower.endswith(".csv"):
+        return iter_csv(path)
+    if lower.endswith(".wkt"):
+        return iter_wkt(path)
+    return read_binary(path)
+
+def iter_wkt_polygons(path: str) -> Iterator[List[List[Point]]]:
+    """
+    Yields one list of rings per POLYGON / MULTIPOLYGON line (all parts
+    of a multipolygon are validated together). The repeated closing
+    vertex of each WKT ring is dropped.
+    """
+    with open(path) as f:
+        for line in f:
+            head = line.lstrip()[:20].upper()
+            if not head.startswith(("POLYGON", "MULTIPOLYGON")):
+                continue
+            rings = []
+            for pts in _wkt_paths(line):
+                if len(pts) > 1 and pts[0] == pts[-1]:
+                    pts.pop()
+                rings.append(pts)
+            yield rings
@@ -0,0 +1,87 @@
+## GroupID-20 (22114029_22113078) - Dhruv, Komal
+## Date: Nov 5, 2025
+## sinks.py - Bounded-memory consumers of sweep output
+
+import heapq
+import math
+from array import array
+from typing import Callable, List, Tuple
+
+from geometry import Point
+
+Pair = Tuple[int, int]
+
+# A sink is any object with add(x, y, pair); the sweep calls it once for
+# every new (point, pair) (see engine.run_sweep_into). None of the sinks
+# below keep the points, so their memory does not depend on how many
+# intersections there are.
+
+class CountSink:
+    """Counts crossing pairs. Distinct points are in the run's SweepStats.points."""
+    def __init__(self):
+        self.pairs = 0
+
+    def add(self, x: float, y: float, pair: Pair):
+        self.pairs += 1
+
+class DegreeSink:
+    """Per-segment number of crossings: degree[i] for segment i."""
+    def __init__(self, n: int):
+        self.degree = array('Q', bytes(8 * n))
+
+    def add(self, x: float, y: float, pair: Pair):
+        self.degree[pair[0]] += 1
+        self.degree[pair[1]] += 1
+
+    def top(self, k: int) -> List[Tuple[int, int]]:
+        """The k segments with most crossings, as (segment, degree)."""
+        return heapq.nlargest(k, enumerate(self.degree), key=lambda t: t[1])
+
+class GridSink:
+    """
+    Density raster: counts[row][col] of crossings in an nx by ny grid over
+    [xmin, xmax) x [ymin, ymax). Points outside are only counted in
+    `outside`.
+    """
+    def __init__(self, xmin: float, ymin: float, xmax: float, ymax: float,
+                 nx: int = 64, ny: int = 64):
+        self.xmin, self.ymin = xmin, ymin
+        self.nx, self.ny = nx, ny
+        self.sx = nx / (xmax - xmin)
+        self.sy = ny / (ymax - ymin)
+        self.raster = array('Q', bytes(8 * nx * ny))
+        self.outside = 0
+
+    def add(self, x: float, y: float, pair: Pair):
+        col = math.floor((x - self.xmin) * self.sx)
+        row = math.floor((y - self.ymin) * self.sy)
+        if 0 <= col < self.nx and 0 <= row < self.ny:
+            self.raster[row * self.nx + col] += 1
+        else:
+            self.outside += 1
+
+    @property
+    def counts(self) -> List[List[int]]:
+        nx = self.nx
+        return [self.raster[r*nx:(r+1)*nx].tolist() for r in range(self.ny)]
+
+class TopKSink:
+    """
+    The k (point, pair) reports with the largest key(x, y, pair), kept in a
+    size-k min-heap; e.g. key=lambda x, y, pair: -x keeps the k leftmost.
+    """
+    def __init__(self, k: int, key: Callable[[float, float, Pair], float]):
+        self.k = k
+        self.key = key
+        self.heap: List[Tuple[float, Point, Pair]] = []
+
+    def add(self, x: float, y: float, pair: Pair):
+        item = (self.key(x, y, pair), (x, y), pair)
+        if len(self.heap) < self.k:
+            heapq.heappush(self.heap, item)
+        elif item[0] > self.heap[0][0]:
+            heapq.heapreplace(self.heap, item)
+
+    def items(self) -> List[Tuple[Point, Pair]]:
+        """Best first."""
+        return [(p, pair) for _, p, pair in sorted(self.heap, reverse=True)]
@@ -0,0 +1,160 @@
+## GroupID-20 (22114029_22113078) - Dhruv, Komal
+## Date: Oct 30, 2025
+## status.py - Ordered sweep status structures
+
+import random
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+# key_fn(seg_id) -> y of the segment just right of the current sweep position
+KeyFn = Callable[[int], float]
+Neighbours = Tuple[Optional[int], Optional[int]]
+
+class ListStatus:
+    """
+    Plain Python list status, kept for benchmarking against SkipListStatus.
+
+    Every operation is O(n).
+    """
+    def __init__(self, key_fn: KeyFn):
+        self.key = key_fn
+        self.order: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.order)
+
+    def __contains__(self, seg_id: int) -> bool:
+        return seg_id in self.order
+
+    def __repr__(self) -> str:
+        return repr(self.order)
+
+    def insert(self, seg_id: int) -> int:
+        yv = self.key(seg_id)
+        pos = 0
+        while pos < len(self.order):
+            if self.key(self.order[pos]) > yv: break
+            pos += 1
+        self.order.insert(pos, seg_id)
+        return pos
+
+    def remove(self, seg_id: int) -> Neighbours:
+        pos = self.order.index(seg_id)
+        nbs = self._at(pos-1), self._at(pos+1)
+        self.order.pop(pos)
+        return nbs
+
+    def neighbours(self, seg_id: int) -> Neighbours:
+        pos = self.order.index(seg_id)
+        return self._at(pos-1), self._at(pos+1)
+
+    def swap(self, s1: int, s2: int):
+        i1, i2 = self.order.index(s1), self.order.index(s2)
+        self.order[i1], self.order[i2] = s2, s1
+
+    def _at(self, pos: int) -> Optional[int]:
+        return self.order[pos] if 0 <= pos < len(self.order) else None
+
+
+class _Node:
+    __slots__ = ("seg_id", "next", "prev")
+
+    def __init__(self, seg_id: Optional[int], height: int):
+        self.seg_id = seg_id
+        self.next: List[Optional["_Node"]] = [None] * height
+        self.prev: List[Optional["_Node"]] = [None] * height
+
+
+class SkipListStatus:
+    """
+    Doubly-linked skip list ordered by the segments' y at the sweep line.
+
+    Keys are never stored: the order of the segments in the status only
+    changes at intersection events (handled by swap), so comparisons are
+    done against key_fn evaluated at the current sweep position. A seg_id
+    -> node map gives O(1) access for removal, swap and neighbour lookup;
+    insertion is an expected O(log n) search.
+    """
+    MAX_HEIGHT = 32
+
+    def __init__(self, key_fn: KeyFn, seed: int = 0x5eed):
+        self.key = key_fn
+        self.head = _Node(None, self.MAX_HEIGHT)
+        self.height = 1
+        self.nodes: Dict[int, _Node] = {}
+        self._rng = random.Random(seed)
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __iter__(self) -> Iterator[int]:
+        node = self.head.next[0]
+        while node is not None:
+            yield node.seg_id
+            node = node.next[0]
+
+    def __contains__(self, seg_id: int) -> bool:
+        return seg_id in self.nodes
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    def _random_height(self) -> int:
+        h = 1
+        while h < self.MAX_HEIGHT and self._rng.random() < 0.5:
+            h += 1
+        return h
+
+    def insert(self, seg_id: int) -> _Node:
+        """Inserts after every segment whose key is <= the new one."""
+        yv = self.key(seg_id)
+        h = self._random_height()
+        self.height = max(self.height, h)
+        node = _Node(seg_id, h)
+
+        cur = self.head
+        for lvl in range(self.height-1, -1, -1):
+            nxt = cur.next[lvl]
+            while nxt is not None and self.key(nxt.seg_id) <= yv:
+                cur = nxt
+                nxt = cur.next[lvl]
+            if lvl < h:
+                node.next[lvl] = nxt
+                node.prev[lvl] = cur
+                cur.next[lvl] = node
+                if nxt is not None:
+                    nxt.prev[lvl] = node
+        self.nodes[seg_id] = node
+        return node
+
+    def remove(self, seg_id: int) -> Neighbours:
+        node = self.nodes.pop(seg_id)
+        nbs = self._ids(node)
+        for lvl in range(len(node.next)):
+            prv, nxt = node.prev[lvl], node.next[lvl]
+            prv.next[lvl] = nxt
+            if nxt is not None:
+                nxt.prev[lvl] = prv
+        return nbs
+
+    def neighbours(self, seg_id: int) -> Neighbours:
+        return self._ids(self.nodes[seg_id])
+
+    def swap(self, s1: int, s2: int):
+        n1, n2 = self.nodes[s1], self.nodes[s2]
+        n1.seg_id, n2.seg_id = s2, s1
+        self.nodes[s1], self.nodes[s2] = n2, n1
+
+    @staticmethod
+    def _ids(node: _Node) -> Neighbours:
+        prv, nxt = node.prev[0], node.next[0]
+        return (prv.seg_id if prv is not None else None,
+                nxt.seg_id if nxt is not None else None)
+
+
+STATUS_TYPES = {
+    "list": ListStatus,
+    "skiplist": SkipListStatus,
+}
@@ -2,59 +2,88 @@
 ## Date: Oct 28, 2025
 ## sweep_line.py - Sweep line algorithm implementation
 
-from typing import List, Optional, Tuple
-from geometry import segment_intersection, y_at, EPS
-from segment import Segment, Event
+import heapq
+from typing import List, Optional, Tuple, Union
+from geometry import PREDICATES, EPS
+from segment import Segment, SegmentStore, Event
+from status import STATUS_TYPES
+from intersection_set import IntersectionSet
+from sweep_trace import Tracer, TRACE_DEBUG
+from sweep_metrics import SweepMetrics
 
 class SweepLine:
-    def __init__(self, segments: List[Segment], log_fn=print):
-        self.segments = segments
-        self.status_order: List[int] = []
-        self.intersections: List[Tuple[float, float]] = []
+    """
+    Bentley-Ottmann sweep over a list of segments indexed by id.
+
+    `status` selects the status structure: "skiplist" (O(log n) per
+    operation, the default) or "list" (the original O(n) list).
+    `trace_level` limits what is sent to `log_fn` (see sweep_trace.py); nothing
+    is formatted for levels that are switched off.
+    `predicates` is "eps" (the fixed-EPS tests) or "robust" (exact signs
+    behind a float filter, see geometry.segment_intersection_robust).
+    `metrics` takes a SweepMetrics to fill in; None (the default) records
+    nothing.
+    """
+    def __init__(self, segments: Union[SegmentStore, List[Segment]], log_fn=print,
+                 status: str = "skiplist", trace_level: int = TRACE_DEBUG,
+                 predicates: str = "eps", metrics: Optional[SweepMetrics] = None):
+        # the engine works on the array-backed store; Segment lists are converted
+        self.segments = SegmentStore.from_segments(segments)
+        self.status = STATUS_TYPES[status](self._status_key)
+        self.intersections = IntersectionSet()
         self.sweep_x = 0.0
-        self.log = log_fn
-
-    def insert_status(self, seg_id: int, x: float):
-        seg = self.segments[seg_id]
-        yv = y_at((seg.a, seg.b), x + EPS) 
-        pos = 0
-        while pos < len(self.status_order):
-            s2 = self.segments[self.status_order[pos]]
-            y2 = y_at((s2.a, s2.b), x + EPS)
-            if y2 > yv: break
-            pos += 1
-        self.status_order.insert(pos, seg_id)
-        self.log(f"Inserted S{seg_id} at pos {pos}. Status: {self.status_order}")
-        return pos
+        self.sweep_y = 0.0
+        self._key_x = 0.0
+        self._verticals: List[Tuple[float, int]] = []   # (top, id) heap of verticals at _verticals_x
+        self._verticals_x: Optional[float] = None
+        self.predicates = predicates
+        self._intersect = PREDICATES[predicates]
+        self.trace = Tracer(log_fn, trace_level)
+        self.metrics = metrics
+
+    @property
+    def status_order(self) -> List[int]:
+        return list(self.status)
+
+    def _status_key(self, seg_id: int) -> float:
+        return self.segments.y_at(seg_id, self._key_x)
+
+    def insert_status(self, seg_id: int, x: float) -> Tuple[Optional[int], Optional[int]]:
+        """Inserts seg_id at x and returns its (below, above) neighbours."""
+        self._key_x = x + EPS
+        self.status.insert(seg_id)
+        if self.trace.debug: self.trace.emit("Inserted S{}. Status: {}", seg_id, self.status)
+        return self.status.neighbours(seg_id)
 
     def remove_status(self, seg_id: int):
-        if seg_id not in self.status_order: 
-            self.log(f"Warning: S{seg_id} not in status for removal.")
+        if seg_id not in self.status:
+            if self.trace.warn: self.trace.emit("Warning: S{} not in status for removal.", seg_id)
             return (None, None)
-        pos = self.status_order.index(seg_id)
-        left = self.status_order[pos-1] if pos-1 >= 0 else None
-        right = self.status_order[pos+1] if pos+1 < len(self.status_order) else None
-        self.status_order.pop(pos)
-        self.log(f"Removed S{seg_id}. Status: {self.status_order}")
+        left, right = self.status.remove(seg_id)
+        if self.trace.debug: self.trace.emit("Removed S{}. Status: {}", seg_id, self.status)
         return (left, right)
 
     def swap(self, s1: int, s2: int):
-        try:
-            i1, i2 = self.status_order.index(s1), self.status_order.index(s2)
-        except ValueError:
-            self.log(f"Warning: Tried to swap S{s1}, S{s2} but one not in status.")
+        if s1 not in self.status or s2 not in self.status:
+            if self.trace.warn: self.trace.emit("Warning: Tried to swap S{}, S{} but one not in status.", s1, s2)
             return
-        # Ensure i1 is always the lower index
-        if i1 > i2:
-            i1, i2 = i2, i1
-            s1, s2 = s2, s1
-            
-        self.status_order[i1], self.status_order[i2] = self.status_order[i2], self.status_order[i1]
-        self.log(f"Swapped S{s1} and S{s2}. Status: {self.status_order}")
-
+        self.status.swap(s1, s2)
+        if self.trace.debug: self.trace.emit("Swapped S{} and S{}. Status: {}", s1, s2, self.status)
+
+    def _ordered(self, s1: int, s2: int) -> Tuple[int, int]:
+        """Returns (lower, upper) for two segments currently in the status."""
+        if self.status.neighbours(s1)[1] == s2: return s1, s2
+        if self.status.neighbours(s2)[1] == s1: return s2, s1
+        # not adjacent (several segments through one point): compare just
+        # left of the event, where the status order is still valid
+        self._key_x = self.sweep_x - EPS
+        return (s1, s2) if self._status_key(s1) <= self._status_key(s2) else (s2, s1)
 
     def process_event(self, ev: Event) -> List[Event]:
         self.sweep_x = ev.x
+        self.sweep_y = ev.y
+        if self.metrics is not None:
+            return self._process_event_measured(ev, self.metrics)
         new_events: List[Event] = []
         
         if ev.type == 'L':
@@ -64,83 +93,154 @@ class SweepLine:
         elif ev.type == 'I':
             new_events = self._process_intersection(ev)
 
-        return [e for e in new_events if e.x > self.sweep_x + EPS]
-
-    def _add_intersection(self, x: float, y: float) -> bool:
-        for (x0, y0) in self.intersections:
-            if abs(x-x0) < EPS and abs(y-y0) < EPS:
-                return False
-        self.intersections.append((x,y))
+        return self._ahead(new_events)
+
+    def _process_event_measured(self, ev: Event, m: SweepMetrics) -> List[Event]:
+        m.on_event(ev.type, len(self.status))
+        handler = {'L': self._process_left, 'R': self._process_right,
+                   'I': self._process_intersection}[ev.type]
+        if m.timers:
+            t0 = m.clock()
+            new_events = handler(ev)
+            m.phase_seconds[ev.type] += m.clock() - t0
+        else:
+            new_events = handler(ev)
+        return self._ahead(new_events)
+
+    def _ahead(self, new_events: List[Event]) -> List[Event]:
+        """
+        The events still ahead of the sweep point: right of it, or at the
+        same x and above it. A crossing at the point itself (a segment
+        starting or ending on another) is reported now instead of dropped.
+        """
+        x, y = self.sweep_x, self.sweep_y
+        ahead: List[Event] = []
+        for e in new_events:
+            if e.x > x + EPS or (e.x > x - EPS and e.y > y + EPS):
+                ahead.append(e)
+            elif abs(e.x - x) <= EPS and abs(e.y - y) <= EPS:
+                self._report_intersection(e, *e.seg_ids)
+        return ahead
+
+    def _add_intersection(self, x: float, y: float, pair: Optional[Tuple[int, int]] = None) -> bool:
+        return self.intersections.add(x, y, pair)
+
+    def _reportable(self, s1: int, s2: int) -> bool:
+        """Whether a crossing of s1 and s2 counts as a result (see PolygonSweep)."""
         return True
 
-    def _process_left(self, ev: Event) -> List[Event]:
-        sid = ev.seg_ids[0]
-        pos = self.insert_status(sid, ev.x)
-        left = self.status_order[pos-1] if pos > 0 else None
-        right = self.status_order[pos+1] if pos+1 < len(self.status_order) else None
-        
+    def _report_intersection(self, ev: Event, s1: int, s2: int):
+        if self._reportable(s1, s2) and self._add_intersection(ev.x, ev.y, (s1, s2)):
+            if self.trace.info:
+                self.trace.emit("INTERSECTION at ({:.2f}, {:.2f}) between S{} and S{}", ev.x, ev.y, s1, s2)
+
+    def _test_pairs(self, pairs: List[Tuple[int, int]]) -> List[Event]:
+        """Runs the neighbour checks queued by one event and returns the 'I' events found."""
         new_events: List[Event] = []
-        for nb_id in (left, right):
-            if nb_id is None: continue
-            
-            r = segment_intersection(self.segments[sid].a, self.segments[sid].b,
-                                     self.segments[nb_id].a, self.segments[nb_id].b)
-            if r: 
-                x, y = r
-                self.log(f"Found new intersection: S{sid} and S{nb_id}")
-                new_events.append(Event(x, y, 'I', (sid, nb_id)))
+        endpoints, intersect = self.segments.endpoints, self._intersect
+        for s1, s2 in pairs:
+            r = intersect(*endpoints(s1), *endpoints(s2))
+            if r:
+                if self.trace.debug: self.trace.emit("Found new intersection: S{} and S{}", s1, s2)
+                new_events.append(Event(r[0], r[1], 'I', (s1, s2)))
+        if self.metrics is not None:
+            self.metrics.on_tests(len(pairs), len(new_events))
         return new_events
 
+    def is_vertical(self, seg_id: int) -> bool:
+        return self.segments.x2[seg_id] - self.segments.x1[seg_id] < EPS
+
+    def _verticals_at(self, x: float, y: float) -> List[Tuple[float, int]]:
+        """
+        The verticals met at this x that reach up to y (reset when x moves
+        on). 'L' events at one x come in increasing y, so a vertical whose
+        top is below y can never meet a later start and is dropped: every
+        vertical left contains y, and each pair handed out is a hit.
+        """
+        if self._verticals_x is None or abs(x - self._verticals_x) > EPS:
+            self._verticals_x = x
+            self._verticals = []
+        verticals = self._verticals
+        while verticals and verticals[0][0] < y - EPS:
+            heapq.heappop(verticals)
+        return verticals
+
+    def vertical_pairs(self, seg_id: int, x: float) -> List[Tuple[int, int]]:
+        """
+        The pairs to test for the vertical seg_id at its 'L' event.
+
+        A vertical never enters the status: a crossing on it has the same x
+        as its 'R' event, so the swap could not be scheduled in time, and
+        every status segment within its y-range can meet it, not just its
+        neighbours. Those are found by a range walk from its lower end, plus
+        the verticals at the same x still reaching its lower end. Segments
+        starting on it later at this x pair with it through
+        segment_pairs_at_x.
+        """
+        segs = self.segments
+        lo, hi = segs.y1[seg_id], segs.y2[seg_id]
+        self._key_x = x
+        self.status.insert(seg_id)
+        below, above = self.status.neighbours(seg_id)
+        others: List[int] = []
+        while above is not None and segs.y_at(above, x) <= hi + EPS:
+            others.append(above)
+            above = self.status.neighbours(above)[1]
+        while below is not None and segs.y_at(below, x) >= lo - EPS:
+            others.append(below)
+            below = self.status.neighbours(below)[0]
+        self.status.remove(seg_id)
+        verticals = self._verticals_at(x, lo)
+        others.extend(v for _, v in verticals)
+        heapq.heappush(verticals, (hi, seg_id))
+        return [(seg_id, o) for o in others]
+
+    def segment_pairs_at_x(self, seg_id: int, x: float) -> List[Tuple[int, int]]:
+        """Pairs of a segment starting at x with the verticals through its start."""
+        return [(seg_id, v) for _, v in self._verticals_at(x, self.segments.y1[seg_id])]
+
+    def _process_left(self, ev: Event) -> List[Event]:
+        sid = ev.seg_ids[0]
+        if self.is_vertical(sid):
+            self._report_now(self.vertical_pairs(sid, ev.x))
+            return []
+        self._report_now(self.segment_pairs_at_x(sid, ev.x))
+        left, right = self.insert_status(sid, ev.x)
+        return self._test_pairs([(sid, nb_id) for nb_id in (left, right) if nb_id is not None])
+
+    def _report_now(self, pairs: List[Tuple[int, int]]):
+        # crossings on a vertical lie at the current x: report them directly
+        if not pairs:
+            return
+        for e in self._test_pairs(pairs):
+            self._report_intersection(e, *e.seg_ids)
+
     def _process_right(self, ev: Event) -> List[Event]:
         sid = ev.seg_ids[0]
+        if self.is_vertical(sid):
+            return []
         left, right = self.remove_status(sid)
-        
-        new_events: List[Event] = []
-        if left is not None and right is not None:
-            r = segment_intersection(self.segments[left].a, self.segments[left].b,
-                                     self.segments[right].a, self.segments[right].b)
-            if r:
-                x, y = r
-                self.log(f"Found new intersection: S{left} and S{right}")
-                new_events.append(Event(x, y, 'I', (left, right)))
-        return new_events
+        if left is None or right is None:
+            return []
+        return self._test_pairs([(left, right)])
 
     def _process_intersection(self, ev: Event) -> List[Event]:
         s1, s2 = ev.seg_ids
         if s1 is None or s2 is None: return []
 
-        if self._add_intersection(ev.x, ev.y):
-             self.log(f"INTERSECTION at ({ev.x:.2f}, {ev.y:.2f}) between S{s1} and S{s2}")
+        self._report_intersection(ev, s1, s2)
 
-        try:
-            i1 = self.status_order.index(s1)
-            i2 = self.status_order.index(s2)
-        except ValueError:
-            self.log(f"Warning: S{s1} or S{s2} not in status for intersection.")
+        if s1 not in self.status or s2 not in self.status:
+            if self.trace.warn: self.trace.emit("Warning: S{} or S{} not in status for intersection.", s1, s2)
             return []
-        if i1 < i2:
-            i1, i2 = i2, i1
-            s1, s2 = s2, s1
+        # s1 is the upper segment; after the swap it moves below s2
+        s2, s1 = self._ordered(s1, s2)
         self.swap(s1, s2)
         
-        s1_below = self.status_order[i2 - 1] if i2 > 0 else None
-        s2_above = self.status_order[i1 + 1] if i1 + 1 < len(self.status_order) else None
+        s1_below = self.status.neighbours(s1)[0]
+        s2_above = self.status.neighbours(s2)[1]
 
-        new_events: List[Event] = []
-        
-        if s1_below is not None:
-            r = segment_intersection(self.segments[s1].a, self.segments[s1].b,
-                                     self.segments[s1_below].a, self.segments[s1_below].b)
-            if r: 
-                self.log(f"Found new intersection: S{s1} and S{s1_below}")
-                new_events.append(Event(r[0], r[1], 'I', (s1_below, s1)))
-
-        if s2_above is not None:
-            r = segment_intersection(self.segments[s2].a, self.segments[s2].b,
-                                     self.segments[s2_above].a, self.segments[s2_above].b)
-            if r:
-                self.log(f"Found new intersection: S{s2} and S{s2_above}")
-                new_events.append(Event(r[0], r[1], 'I', (s2, s2_above)))
-            
-        return new_events
-    
\ No newline at end of file
+        pairs: List[Tuple[int, int]] = []
+        if s1_below is not None: pairs.append((s1, s1_below))
+        if s2_above is not None: pairs.append((s2, s2_above))
+        return self._test_pairs(pairs)
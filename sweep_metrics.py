@@ -0,0 +1,65 @@
+## GroupID-20 (22114029_22113078) - Dhruv, Komal
+## Date: Nov 3, 2025
+## sweep_metrics.py - Structured counters, timers and status histogram
+
+import json
+import time
+from typing import Dict, List, Tuple
+
+class SweepMetrics:
+    """
+    Hot-path metrics for one SweepLine run.
+
+    Off by default: a sweep only records anything when given an instance
+    (SweepLine(..., metrics=SweepMetrics())), and the unmeasured path
+    costs a single `is None` test per event. Per-phase timers and the
+    status-size time series are opt-in on top of that.
+    """
+    def __init__(self, timers: bool = False, series_every: int = 0):
+        self.timers = timers
+        self.series_every = series_every
+        self.events: Dict[str, int] = {'L': 0, 'R': 0, 'I': 0}
+        self.intersection_tests = 0
+        self.intersection_hits = 0
+        self.duplicates = 0                  # 'I' events dropped by the queue
+        self.max_status = 0
+        self.status_histogram: Dict[int, int] = {}   # bucket 2^k -> events seen at size < 2^k
+        self.status_series: List[Tuple[int, int]] = []
+        self.phase_seconds: Dict[str, float] = {'L': 0.0, 'R': 0.0, 'I': 0.0}
+        self._n_events = 0
+
+    def on_event(self, ev_type: str, status_size: int):
+        self.events[ev_type] += 1
+        self._n_events += 1
+        if status_size > self.max_status:
+            self.max_status = status_size
+        bucket = 1 << status_size.bit_length()
+        self.status_histogram[bucket] = self.status_histogram.get(bucket, 0) + 1
+        if self.series_every and self._n_events % self.series_every == 0:
+            self.status_series.append((self._n_events, status_size))
+
+    def on_tests(self, tests: int, hits: int):
+        self.intersection_tests += tests
+        self.intersection_hits += hits
+
+    @staticmethod
+    def clock() -> float:
+        return time.perf_counter()
+
+    def to_dict(self) -> Dict:
+        return {
+            "events": dict(self.events),
+            "events_total": self._n_events,
+            "intersection_tests": self.intersection_tests,
+            "intersection_hits": self.intersection_hits,
+            "hit_rate": self.intersection_hits / self.intersection_tests
+                        if self.intersection_tests else 0.0,
+            "duplicates_suppressed": self.duplicates,
+            "max_status": self.max_status,
+            "status_histogram": {f"<{k}": v for k, v in sorted(self.status_histogram.items())},
+            "status_series": self.status_series,
+            "phase_seconds": dict(self.phase_seconds) if self.timers else None,
+        }
+
+    def to_json(self, **kw) -> str:
+        return json.dumps(self.to_dict(), **kw)
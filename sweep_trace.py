@@ -0,0 +1,28 @@
+## GroupID-20 (22114029_22113078) - Dhruv, Komal
+## Date: Oct 30, 2025
+## sweep_trace.py - Leveled, lazily formatted tracing for the sweep
+
+TRACE_OFF = 0
+TRACE_WARN = 1     # inconsistencies such as "not in status"
+TRACE_INFO = 2     # reported intersections
+TRACE_DEBUG = 3    # every status mutation, candidate and scheduled event
+
+class Tracer:
+    """
+    Sends messages at or below `level` to `log_fn`.
+
+    Callers test the `warn`/`info`/`debug` flags before calling `emit`, and
+    pass format arguments instead of a pre-built string, so a disabled
+    level costs one attribute lookup and builds no text at all.
+    """
+    def __init__(self, log_fn=print, level: int = TRACE_DEBUG):
+        if log_fn is None:
+            level = TRACE_OFF
+        self.log_fn = log_fn
+        self.level = level
+        self.warn = level >= TRACE_WARN
+        self.info = level >= TRACE_INFO
+        self.debug = level >= TRACE_DEBUG
+
+    def emit(self, fmt: str, *args):
+        self.log_fn(fmt.format(*args) if args else fmt)
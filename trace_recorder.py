@@ -0,0 +1,221 @@
+## GroupID-20 (22114029_22113078) - Dhruv, Komal
+## Date: Nov 4, 2025
+## trace_recorder.py - Recorded sweep traces with checkpointed seeking
+
+import mmap
+import struct
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from geometry import Point
+from segment import Event, SegmentStore, pack_event, unpack_event
+from sweep_line import SweepLine
+from event_queue import EventQueue
+from engine import as_segments
+
+# Trace file layout (all little-endian):
+#   HEADER                        magic, checkpoint interval, segments, steps, index offset
+#   n_segments * SEG_ROW          x1, y1, x2, y2 in the original orientation
+#   records                       a checkpoint before every `interval`-th step, then the step
+#   POINT_COUNT, n * POINT        every intersection point, in the order found
+#   n_steps * Q, n_checkpoints * Q  file offsets of the step and checkpoint records
+# A step record is STEP (the event, #ops, #new points) followed by #ops OP
+# records; a checkpoint is CHECKPOINT (#points so far, status size) followed
+# by the status, bottom to top.
+MAGIC = b"BOTRC\x00\x01\x00"
+HEADER = struct.Struct("<8sIQQQ")
+SEG_ROW = struct.Struct("<4d")
+STEP = struct.Struct("<ddBiiII")
+OP = struct.Struct("<Bii")
+CHECKPOINT = struct.Struct("<QI")
+POINT_COUNT = struct.Struct("<Q")
+POINT = struct.Struct("<2d")
+
+# status mutations: insert seg just above `below` (-1: at the bottom),
+# remove seg, swap the positions of two segments
+OP_INSERT, OP_REMOVE, OP_SWAP = 0, 1, 2
+
+Op = Tuple[int, int, int]
+
+class RecordingSweep(SweepLine):
+    """SweepLine that logs its status mutations and new points for the recorder."""
+    def __init__(self, segments: SegmentStore, **kw):
+        super().__init__(segments, log_fn=None, **kw)
+        self.ops: List[Op] = []
+        self.new_points = 0
+
+    def insert_status(self, seg_id: int, x: float):
+        below, above = super().insert_status(seg_id, x)
+        self.ops.append((OP_INSERT, seg_id, -1 if below is None else below))
+        return below, above
+
+    def remove_status(self, seg_id: int):
+        if seg_id in self.status:
+            self.ops.append((OP_REMOVE, seg_id, -1))
+        return super().remove_status(seg_id)
+
+    def swap(self, s1: int, s2: int):
+        if s1 in self.status and s2 in self.status:
+            self.ops.append((OP_SWAP, s1, s2))
+        super().swap(s1, s2)
+
+    def _add_intersection(self, x: float, y: float, pair=None) -> bool:
+        is_new = super()._add_intersection(x, y, pair)
+        if is_new:
+            self.new_points += 1
+        return is_new
+
+def record_trace(segments: Sequence, path: str, checkpoint_every: int = 1024,
+                 status: str = "skiplist", predicates: str = "eps") -> int:
+    """
+    Runs the sweep over `segments` once and writes its trace to `path`.
+    Returns the number of steps (events processed).
+    """
+    segs = as_segments(segments)
+    sweep = RecordingSweep(segs, status=status, predicates=predicates)
+    queue = EventQueue.from_segments(segs)
+    step_offsets: List[int] = []
+    checkpoint_offsets: List[int] = []
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, checkpoint_every, len(segs), 0, 0))
+        for i in range(len(segs)):
+            (ax, ay), (bx, by) = segs.endpoints(i)
+            f.write(SEG_ROW.pack(ax, ay, bx, by))
+        step = 0
+        while queue:
+            if step % checkpoint_every == 0:
+                checkpoint_offsets.append(f.tell())
+                order = list(sweep.status)
+                f.write(CHECKPOINT.pack(len(sweep.intersections), len(order)))
+                f.write(struct.pack(f"<{len(order)}i", *order))
+            ev = queue.pop()
+            sweep.ops.clear()
+            sweep.new_points = 0
+            for new_ev in sweep.process_event(ev):
+                queue.push(new_ev)
+            x, y, code, s1, s2 = pack_event(ev)
+            step_offsets.append(f.tell())
+            f.write(STEP.pack(x, y, code, s1, s2, len(sweep.ops), sweep.new_points))
+            f.write(b"".join(OP.pack(*op) for op in sweep.ops))
+            step += 1
+        index_offset = f.tell()
+        f.write(POINT_COUNT.pack(len(sweep.intersections)))
+        f.write(b"".join(POINT.pack(x, y) for x, y in sweep.intersections))
+        f.write(struct.pack(f"<{len(step_offsets)}Q", *step_offsets))
+        f.write(struct.pack(f"<{len(checkpoint_offsets)}Q", *checkpoint_offsets))
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, checkpoint_every, len(segs), step, index_offset))
+    return step
+
+class TraceState(NamedTuple):
+    step: int                   # number of events processed
+    event: Optional[Event]      # the last one (None at step 0)
+    status: List[int]           # bottom to top
+    n_points: int               # points found so far: TraceReader.points(n_points)
+
+class TraceReader:
+    """
+    Random access to a recorded trace.
+
+    seek(k) rebuilds the state after k events from the nearest checkpoint
+    at or before k, replaying at most `interval` step records on a linked
+    status, so seeking costs O(interval) in either direction and never
+    re-runs the geometry. Seeking a little forward from the last state
+    continues from it instead.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.interval, n_segs, self.n_steps, index = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path}: not a sweep trace (bad magic {magic!r})")
+        self.segments = SegmentStore.from_rows(
+            SEG_ROW.unpack_from(self._mm, HEADER.size + i * SEG_ROW.size) for i in range(n_segs))
+        (self.total_points,) = POINT_COUNT.unpack_from(self._mm, index)
+        self._points_at = index + POINT_COUNT.size
+        off = self._points_at + self.total_points * POINT.size
+        self.step_offsets = struct.unpack_from(f"<{self.n_steps}Q", self._mm, off)
+        off += self.n_steps * 8
+        n_checkpoints = (self.n_steps + self.interval - 1) // self.interval
+        self.checkpoint_offsets = struct.unpack_from(f"<{n_checkpoints}Q", self._mm, off)
+        # current state: linked status with sentinel -1 (next[-1] is the bottom)
+        self._next: Dict[int, int] = {-1: -1}
+        self._prev: Dict[int, int] = {-1: -1}
+        self._step = 0
+        self._event: Optional[Event] = None
+        self._n_points = 0
+        self._loaded = False
+
+    def __len__(self) -> int:
+        return self.n_steps
+
+    def close(self):
+        self._mm.close()
+
+    def points(self, stop: Optional[int] = None, start: int = 0) -> List[Point]:
+        """Intersection points start..stop-1 in the order found (all by default)."""
+        stop = self.total_points if stop is None else stop
+        n = max(0, stop - start)
+        flat = struct.unpack_from(f"<{2*n}d", self._mm, self._points_at + start * POINT.size)
+        return list(zip(flat[0::2], flat[1::2]))
+
+    def event(self, k: int) -> Event:
+        """Event processed by step k (0-based)."""
+        x, y, code, s1, s2, _, _ = STEP.unpack_from(self._mm, self.step_offsets[k])
+        return unpack_event((x, y, code, s1, s2))
+
+    def seek(self, k: int) -> TraceState:
+        """State after the first k events, 0 <= k <= len(self)."""
+        k = max(0, min(k, self.n_steps))
+        if not self.checkpoint_offsets:
+            return TraceState(0, None, [], 0)
+        c = k // self.interval
+        if c == len(self.checkpoint_offsets):
+            c -= 1      # k == n_steps on an exact multiple of the interval
+        if not (self._loaded and c * self.interval <= self._step <= k):
+            self._load_checkpoint(c)
+        while self._step < k:
+            self._apply_step(self._step)
+        status = []
+        s = self._next[-1]
+        while s != -1:
+            status.append(s)
+            s = self._next[s]
+        return TraceState(self._step, self._event, status, self._n_points)
+
+    def _load_checkpoint(self, c: int):
+        off = self.checkpoint_offsets[c]
+        self._n_points, size = CHECKPOINT.unpack_from(self._mm, off)
+        order = struct.unpack_from(f"<{size}i", self._mm, off + CHECKPOINT.size)
+        chain = (-1,) + order + (-1,)
+        self._next = {chain[i]: chain[i+1] for i in range(len(chain) - 1)}
+        self._prev = {chain[i+1]: chain[i] for i in range(len(chain) - 1)}
+        self._step = c * self.interval
+        self._event = self.event(self._step - 1) if self._step else None
+        self._loaded = True
+
+    def _apply_step(self, k: int):
+        off = self.step_offsets[k]
+        x, y, code, s1, s2, n_ops, new_points = STEP.unpack_from(self._mm, off)
+        off += STEP.size
+        nxt, prv = self._next, self._prev
+        for _ in range(n_ops):
+            op, a, b = OP.unpack_from(self._mm, off)
+            off += OP.size
+            if op == OP_INSERT:
+                above = nxt[b]
+                nxt[b], prv[a], nxt[a], prv[above] = a, b, above, a
+            elif op == OP_REMOVE:
+                p, n = prv.pop(a), nxt.pop(a)
+                nxt[p], prv[n] = n, p
+            else:
+                # relabel a <-> b: every link touching either one is rewritten
+                sw = {a: b, b: a}
+                touched = {a, b, nxt[a], prv[a], nxt[b], prv[b]}
+                old = {v: (prv[v], nxt[v]) for v in touched}
+                for v, (p, n) in old.items():
+                    prv[sw.get(v, v)] = sw.get(p, p)
+                    nxt[sw.get(v, v)] = sw.get(n, n)
+        self._n_points += new_points
+        self._event = unpack_event((x, y, code, s1, s2))
+        self._step = k + 1
@@ -0,0 +1,165 @@
+## GroupID-20 (22114029_22113078) - Dhruv, Komal
+## Date: Oct 31, 2025
+## vectorized.py - NumPy bulk intersection kernel (optional dependency)
+
+from typing import Iterator, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:           # the sweep itself only needs the standard library
+    np = None
+
+from geometry import EPS
+
+HAVE_NUMPY = np is not None
+
+# Rough per-unit costs (seconds) used to pick brute force over the sweep:
+# one Python sweep event (per log n), one pair in the NumPy kernel, and
+# storing one reported point.
+SWEEP_EVENT_COST = 2.5e-6
+KERNEL_PAIR_COST = 1.8e-7
+RESULT_COST = 1e-6
+
+# below this many pairs a scalar loop beats NumPy dispatch
+VECTOR_BATCH_MIN = 32
+
+def store_columns(store) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray", "np.ndarray"]:
+    """Zero-copy views of a SegmentStore's x1, y1, x2, y2 columns (left end first)."""
+    return tuple(np.frombuffer(col, dtype=np.float64) if len(col) else np.zeros(0)
+                 for col in (store.x1, store.y1, store.x2, store.y2))
+
+def as_array(segments: Sequence) -> "np.ndarray":
+    """(n, 4) float64 array of x1, y1, x2, y2 from Segments or 4-tuples."""
+    if isinstance(segments, np.ndarray):
+        return np.ascontiguousarray(segments, dtype=np.float64).reshape(-1, 4)
+    if hasattr(segments, "flipped"):        # segment.SegmentStore: original orientation
+        x1, y1, x2, y2 = store_columns(segments)
+        flipped = np.frombuffer(segments.flipped, dtype=np.int8).astype(bool) \
+            if len(segments) else np.zeros(0, dtype=bool)
+        return np.column_stack([np.where(flipped, x2, x1), np.where(flipped, y2, y1),
+                                np.where(flipped, x1, x2), np.where(flipped, y1, y2)])
+    rows = [(s.a[0], s.a[1], s.b[0], s.b[1]) if hasattr(s, "a") else tuple(s)
+            for s in segments]
+    return np.array(rows, dtype=np.float64).reshape(-1, 4)
+
+def orient_many(ax, ay, bx, by, cx, cy) -> "np.ndarray":
+    """Elementwise geometry.orient over arrays."""
+    return (bx-ax)*(cy-ay) - (by-ay)*(cx-ax)
+
+def _on_segment(ax, ay, bx, by, cx, cy):
+    return ((np.minimum(ax, cx) - EPS <= bx) & (bx <= np.maximum(ax, cx) + EPS) &
+            (np.minimum(ay, cy) - EPS <= by) & (by <= np.maximum(ay, cy) + EPS))
+
+def intersect_pairs(segs: "np.ndarray", i: "np.ndarray", j: "np.ndarray"
+                    ) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """
+    Vectorized geometry.segment_intersection(segs[i], segs[j]).
+
+    Returns (hit, x, y); x and y are only meaningful where hit is True.
+    The same operations are applied in the same order as the scalar
+    version, including the general/collinear case split and the priority
+    of the endpoints returned for collinear touches.
+    """
+    p1x, p1y, q1x, q1y = segs[i, 0], segs[i, 1], segs[i, 2], segs[i, 3]
+    p2x, p2y, q2x, q2y = segs[j, 0], segs[j, 1], segs[j, 2], segs[j, 3]
+    o1 = orient_many(p1x, p1y, q1x, q1y, p2x, p2y)
+    o2 = orient_many(p1x, p1y, q1x, q1y, q2x, q2y)
+    o3 = orient_many(p2x, p2y, q2x, q2y, p1x, p1y)
+    o4 = orient_many(p2x, p2y, q2x, q2y, q1x, q1y)
+
+    general = (o1*o2 < -EPS) & (o3*o4 < -EPS)
+    A1, B1 = q1y-p1y, p1x-q1x
+    C1 = (q1y-p1y)*p1x + (p1x-q1x)*p1y
+    A2, B2 = q2y-p2y, p2x-q2x
+    C2 = (q2y-p2y)*p2x + (p2x-q2x)*p2y
+    det = A1*B2 - A2*B1
+    hit = general & (np.abs(det) >= EPS)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x = np.where(hit, (B2*C1 - B1*C2)/det, np.nan)
+        y = np.where(hit, (A1*C2 - A2*C1)/det, np.nan)
+
+    # collinear cases, first match wins as in the scalar cascade
+    todo = ~general
+    for o, (px, py), (bx, by), (cx, cy) in (
+            (o1, (p1x, p1y), (p2x, p2y), (q1x, q1y)),
+            (o2, (p1x, p1y), (q2x, q2y), (q1x, q1y)),
+            (o3, (p2x, p2y), (p1x, p1y), (q2x, q2y)),
+            (o4, (p2x, p2y), (q1x, q1y), (q2x, q2y))):
+        m = todo & (np.abs(o) < EPS) & _on_segment(px, py, bx, by, cx, cy)
+        x = np.where(m, bx, x)
+        y = np.where(m, by, y)
+        hit |= m
+        todo &= ~m
+    return hit, x, y
+
+def _bounds(segs):
+    """Per-segment bounding boxes, widened by EPS on the high side."""
+    lo_x, hi_x = np.minimum(segs[:, 0], segs[:, 2]), np.maximum(segs[:, 0], segs[:, 2]) + EPS
+    lo_y, hi_y = np.minimum(segs[:, 1], segs[:, 3]), np.maximum(segs[:, 1], segs[:, 3]) + EPS
+    return lo_x, hi_x, lo_y, hi_y
+
+def brute_force(segs: "np.ndarray", tile: int = 1024
+                ) -> Iterator[Tuple["np.ndarray", "np.ndarray", "np.ndarray", "np.ndarray"]]:
+    """
+    Tests every pair i < j, one tile x tile block at a time so memory
+    stays O(tile^2). Yields (i, j, x, y) arrays of the hits per block.
+    The bounding-box prefilter is one broadcast of the row bounds against
+    the column bounds per block; only its survivors become index pairs.
+    """
+    n = len(segs)
+    lo_x, hi_x, lo_y, hi_y = _bounds(segs)
+    for r0 in range(0, n, tile):
+        r1 = min(r0 + tile, n)
+        rlx, rhx = lo_x[r0:r1, None], hi_x[r0:r1, None]
+        rly, rhy = lo_y[r0:r1, None], hi_y[r0:r1, None]
+        for c0 in range(r0, n, tile):
+            c1 = min(c0 + tile, n)
+            near = ((rlx <= hi_x[c0:c1]) & (lo_x[c0:c1] <= rhx) &
+                    (rly <= hi_y[c0:c1]) & (lo_y[c0:c1] <= rhy))
+            if c0 == r0:
+                near = np.triu(near, 1)     # i < j on the diagonal block
+            i, j = np.nonzero(near)
+            if not len(i):
+                continue
+            i += r0
+            j += c0
+            hit, x, y = intersect_pairs(segs, i, j)
+            if hit.any():
+                yield i[hit], j[hit], x[hit], y[hit]
+
+def estimate_pairs(segs, samples: int = 4096, seed: int = 0) -> float:
+    """
+    Estimates the number of intersecting pairs from a random pair sample.
+    `segs` is an (n, 4) array or a SegmentStore, whose sampled rows are
+    read straight from its columns.
+    """
+    n = len(segs)
+    if n < 2:
+        return 0.0
+    rng = np.random.default_rng(seed)
+    i = rng.integers(0, n, samples)
+    j = rng.integers(0, n, samples)
+    keep = i != j
+    if not keep.any():
+        return 0.0
+    i, j = i[keep], j[keep]
+    if not isinstance(segs, np.ndarray):
+        # only the sampled rows: i's first, then j's
+        rows = np.concatenate([i, j])
+        segs = np.column_stack([col[rows] for col in store_columns(segs)])
+        i, j = np.arange(len(i)), np.arange(len(i), 2 * len(i))
+    hit, _, _ = intersect_pairs(segs, i, j)
+    return float(hit.mean()) * n * (n - 1) / 2
+
+def prefer_brute_force(segs, k_estimate: Optional[float] = None) -> bool:
+    """
+    True when the tiled kernel is expected to beat the sweep, whose cost
+    grows with (n + k) log n while brute force is n^2 / 2 cheap pair tests.
+    """
+    n = len(segs)
+    if n < 2:
+        return False
+    k = estimate_pairs(segs) if k_estimate is None else k_estimate
+    sweep_cost = SWEEP_EVENT_COST * (2*n + k) * max(1.0, np.log2(n))
+    brute_cost = KERNEL_PAIR_COST * n * (n - 1) / 2 + RESULT_COST * k
+    return brute_cost < sweep_cost
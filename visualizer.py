@@ -3,12 +3,18 @@
 ## visualizer.py - Bentley–Ottmann Sweep Line Visualizer
 
 import tkinter as tk
-from tkinter import ttk
+from tkinter import ttk, filedialog
 import random
-from geometry import EPS
-from segment import Segment, Event
+import time
+from segment import SegmentStore
 from sweep_line import SweepLine
-from bisect import insort
+from event_queue import EventQueue
+from sweep_trace import Tracer, TRACE_WARN
+from trace_recorder import TraceReader, record_trace
+
+FRAME_MS = 16           # animation frame interval
+FRAME_BUDGET = 0.012    # seconds of sweep work per frame when running to the end
+LOG_MAX_LINES = 2000    # the log box keeps only the newest lines
 
 class BentleyVisualizer:
     def __init__(self, master):
@@ -27,83 +33,252 @@ class BentleyVisualizer:
         ttk.Entry(self.right, textvariable=self.n_var, width=6).pack(pady=4)
         ttk.Button(self.right, text="Generate", command=self.generate_segments).pack()
         ttk.Button(self.right, text="Step", command=self.step).pack(pady=4)
+        self.play_text = tk.StringVar(value="Play")
+        ttk.Button(self.right, textvariable=self.play_text, command=self.toggle_play).pack()
+        ttk.Button(self.right, text="Run to end", command=self.run_to_end).pack(pady=4)
+        ttk.Label(self.right, text="events / frame:").pack()
+        self.speed_var = tk.IntVar(value=5)
+        ttk.Entry(self.right, textvariable=self.speed_var, width=6).pack(pady=4)
+        ttk.Button(self.right, text="Record trace", command=self.save_trace).pack()
+        ttk.Button(self.right, text="Load trace", command=self.load_trace).pack(pady=4)
+        self.scrub_var = tk.IntVar(value=0)
+        self.scrub = ttk.Scale(self.right, from_=0, to=0, orient=tk.HORIZONTAL,
+                               variable=self.scrub_var, command=self.on_scrub)
+        self.scrub.pack(fill=tk.X)
 
         self.log_box = tk.Text(self.right, height=25, width=40)
         self.log_box.pack(pady=4)
+        self.log_count = 0
 
-        self.segments, self.event_queue = [], []
+        self.segments, self.event_queue = SegmentStore(), EventQueue()
+        self.seg_colors = []    # display-only data, kept out of the engine's store
         self.sweep = None
+        self.sweep_item = self.marker_item = None
+        self.point_items = []   # canvas ovals of the intersections shown, in order found
+        self.trace_reader = None    # TraceReader when replaying a recorded trace
+        self.trace_pos = 0
+        self.anim_job = None
+        self.anim_mode = None   # None, "play" or "run"
         self.colors = ["#ef4444","#f59e0b","#10b981","#3b82f6","#7c3aed","#ec4899","#0ea5a4"]
 
         self.generate_segments()
 
     def log(self, msg: str):
         self.log_box.insert("1.0", msg + "\n")
+        self.log_count += 1
+        if self.log_count > 2 * LOG_MAX_LINES:     # trim in batches, not on every line
+            self.log_box.delete(f"{LOG_MAX_LINES + 1}.0", tk.END)
+            self.log_count = LOG_MAX_LINES
 
     def generate_segments(self):
+        self.stop_animation()
         n = self.n_var.get()
-        self.canvas.delete("all")
         self.log_box.delete("1.0", tk.END)
-        self.segments = []
+        self.log_count = 0
+        self.close_trace()
+        self.segments = SegmentStore()
         for i in range(n):
             x1, y1 = random.uniform(20, self.W-20), random.uniform(20, self.H-20)
             x2, y2 = random.uniform(20, self.W-20), random.uniform(20, self.H-20)
-            color = self.colors[i % len(self.colors)]
-            seg = Segment(i, (x1, y1), (x2, y2), color)
-            self.segments.append(seg)
-            self.canvas.create_line(x1, y1, x2, y2, fill=color, width=2)
-        
+            self.segments.append((x1, y1), (x2, y2))
+        self.draw_segments()
+
         self.create_event_queue()
         self.sweep = SweepLine(self.segments, log_fn=self.log)
+        # stepping logs every action; animation only logs warnings (and one line at the end)
+        self.step_trace = self.sweep.trace
+        self.anim_trace = Tracer(self.log, TRACE_WARN)
         self.log(f"Generated {n} random segments")
         self.log(f"Created {len(self.event_queue)} initial events")
 
-    def create_event_queue(self):
-        self.event_queue = []
-        for s in self.segments:
-            left = s.a if s.a[0] < s.b[0] else s.b
-            right = s.b if left is s.a else s.a
-            self.event_queue.append(Event(left[0], left[1], 'L', (s.id, None)))
-            self.event_queue.append(Event(right[0], right[1], 'R', (s.id, None)))
+    def draw_segments(self):
+        """Draws self.segments once; later frames only move the sweep items."""
+        self.canvas.delete("all")
+        self.seg_colors = [self.colors[i % len(self.colors)] for i in range(len(self.segments))]
+        for i, color in enumerate(self.seg_colors):
+            (ax, ay), (bx, by) = self.segments.endpoints(i)
+            self.canvas.create_line(ax, ay, bx, by, fill=color, width=2)
+        self.sweep_item = self.canvas.create_line(0, 0, 0, self.H, fill="red", dash=(5,3),
+                                                  state="hidden")
+        self.marker_item = self.canvas.create_rectangle(0, 0, 0, 0, outline="blue", width=2,
+                                                        state="hidden")
+        self.point_items = []
 
-        self.event_queue.sort()
+    def create_event_queue(self):
+        self.event_queue = EventQueue.from_segments(self.segments)
 
     def step(self):
+        self.stop_animation()
+        if self.trace_reader:
+            self.seek_trace(self.trace_pos + 1)
+            return
         if not self.sweep or not self.event_queue:
             self.log("--- End of sweep ---")
             return
         
-        ev = self.event_queue.pop(0)
+        ev = self.event_queue.pop()
         self.log(f"Processing {ev.type} at ({ev.x:.2f}) for S{ev.seg_ids[0]}")
         new_events = self.sweep.process_event(ev)
 
-        if new_events:
-            for new_ev in new_events:
-                is_duplicate = False
-                for existing_ev in self.event_queue:
-                    if existing_ev.type == 'I' and \
-                       abs(existing_ev.x - new_ev.x) < EPS and \
-                       abs(existing_ev.y - new_ev.y) < EPS and \
-                       set(existing_ev.seg_ids) == set(new_ev.seg_ids):
-                        is_duplicate = True
-                        break
-                
-                if not is_duplicate:
-                    self.log(f"SCHEDULING new: {new_ev.type} at ({new_ev.x:.2f}, {new_ev.y:.2f})")
-                    insort(self.event_queue, new_ev)
+        for new_ev in new_events:
+            if self.event_queue.push(new_ev):
+                self.log(f"SCHEDULING new: {new_ev.type} at ({new_ev.x:.2f}, {new_ev.y:.2f})")
 
         self.redraw(ev)
 
+    # --- animation ---
+
+    def toggle_play(self):
+        if self.anim_mode == "play":
+            self.stop_animation()
+        else:
+            self.start_animation("play")
+
+    def run_to_end(self):
+        self.start_animation("run")
+
+    def start_animation(self, mode: str):
+        if not self.sweep and not self.trace_reader:
+            return
+        self.stop_animation()
+        if self.trace_reader and mode == "run":
+            self.seek_trace(len(self.trace_reader))
+            return
+        self.anim_mode = mode
+        if self.sweep:
+            self.sweep.trace = self.anim_trace
+        self.play_text.set("Pause" if mode == "play" else "Play")
+        self.anim_job = self.master.after(FRAME_MS, self.animate)
+
+    def stop_animation(self):
+        if self.anim_job is not None:
+            self.master.after_cancel(self.anim_job)
+            self.anim_job = None
+        self.anim_mode = None
+        if self.sweep:
+            self.sweep.trace = self.step_trace
+        self.play_text.set("Play")
+
+    def animate(self):
+        """
+        One frame: a batch of events (a fixed number in play mode, as many as
+        fit in FRAME_BUDGET when running to the end), then one redraw.
+        """
+        self.anim_job = None
+        if self.trace_reader:
+            self.seek_trace(self.trace_pos + max(1, self.speed_var.get()))
+            if self.trace_pos < len(self.trace_reader):
+                self.anim_job = self.master.after(FRAME_MS, self.animate)
+            else:
+                self.stop_animation()
+            return
+        if self.anim_mode == "play":
+            ev = self.process_batch(max(1, self.speed_var.get()), None)
+        else:
+            ev = self.process_batch(None, time.perf_counter() + FRAME_BUDGET)
+        if ev is not None:
+            self.redraw(ev)
+        if self.event_queue:
+            self.anim_job = self.master.after(FRAME_MS, self.animate)
+        else:
+            self.stop_animation()
+            self.log(f"--- End of sweep: {len(self.sweep.intersections)} intersections ---")
+
+    def process_batch(self, max_events, deadline):
+        """Processes events until the count or the deadline runs out; returns the last one."""
+        queue, sweep = self.event_queue, self.sweep
+        ev = None
+        done = 0
+        while queue:
+            ev = queue.pop()
+            for new_ev in sweep.process_event(ev):
+                queue.push(new_ev)
+            done += 1
+            if max_events is not None and done >= max_events:
+                break
+            # checking the clock every event would cost more than the events
+            if deadline is not None and done % 64 == 0 and time.perf_counter() > deadline:
+                break
+        return ev
+
+    # --- recorded traces ---
+
+    def save_trace(self):
+        path = filedialog.asksaveasfilename(defaultextension=".trc",
+                                            filetypes=[("Sweep trace", "*.trc")])
+        if not path:
+            return
+        steps = record_trace(self.segments, path)
+        self.log(f"Recorded {steps} steps to {path}")
+        self.open_trace(path)
+
+    def load_trace(self):
+        path = filedialog.askopenfilename(filetypes=[("Sweep trace", "*.trc")])
+        if path:
+            self.open_trace(path)
+
+    def open_trace(self, path: str):
+        self.stop_animation()
+        self.close_trace()
+        self.trace_reader = TraceReader(path)
+        self.sweep, self.event_queue = None, EventQueue()
+        self.segments = self.trace_reader.segments
+        self.draw_segments()
+        self.scrub.configure(to=len(self.trace_reader))
+        self.log(f"Loaded trace: {len(self.segments)} segments, {len(self.trace_reader)} steps, "
+                 f"{self.trace_reader.total_points} intersections")
+        self.seek_trace(0)
+
+    def close_trace(self):
+        if self.trace_reader:
+            self.trace_reader.close()
+            self.trace_reader = None
+        self.trace_pos = 0
+        self.scrub_var.set(0)
+        self.scrub.configure(to=0)
+
+    def on_scrub(self, _value=None):
+        if self.trace_reader and self.scrub_var.get() != self.trace_pos:
+            self.seek_trace(self.scrub_var.get())
+
+    def seek_trace(self, k: int):
+        state = self.trace_reader.seek(k)
+        self.trace_pos = state.step
+        self.scrub_var.set(state.step)
+        self.show_points(state.n_points)
+        if state.event is None:
+            self.canvas.itemconfigure(self.sweep_item, state="hidden")
+            self.canvas.itemconfigure(self.marker_item, state="hidden")
+        else:
+            self.move_sweep_items(state.event)
+        self.log(f"Step {state.step}/{len(self.trace_reader)}: {len(state.status)} in status, "
+                 f"{state.n_points} intersections")
+
+    def show_points(self, n: int):
+        """Shows exactly the first n intersections, adding or deleting ovals as needed."""
+        items = self.point_items
+        if n < len(items):
+            for item in items[n:]:
+                self.canvas.delete(item)
+            del items[n:]
+            return
+        if self.trace_reader:
+            new = self.trace_reader.points(n, len(items))
+        else:
+            new = self.sweep.intersections.points[len(items):n]
+        for x, y in new:
+            items.append(self.canvas.create_oval(x-4, y-4, x+4, y+4, fill="black"))
+
     def redraw(self, ev):
-        self.canvas.delete("all")
-        # draw all segments
-        for s in self.segments:
-            self.canvas.create_line(s.a[0], s.a[1], s.b[0], s.b[1], fill=s.color, width=2)
-        # draw intersections
-        for (x, y) in self.sweep.intersections:
-            self.canvas.create_oval(x-4, y-4, x+4, y+4, fill="black")
-        # draw sweep line
-        self.canvas.create_line(ev.x, 0, ev.x, self.H, fill="red", dash=(5,3))
-        # highlight event point
-        self.canvas.create_rectangle(ev.x-5, ev.y-5, ev.x+5, ev.y+5, outline="blue", width=2)
-        
\ No newline at end of file
+        # segments are drawn once by draw_segments; only new intersections,
+        # the sweep line and the event marker change
+        self.show_points(len(self.sweep.intersections))
+        self.move_sweep_items(ev)
+
+    def move_sweep_items(self, ev):
+        self.canvas.coords(self.sweep_item, ev.x, 0, ev.x, self.H)
+        self.canvas.coords(self.marker_item, ev.x-5, ev.y-5, ev.x+5, ev.y+5)
+        self.canvas.itemconfigure(self.sweep_item, state="normal")
+        self.canvas.itemconfigure(self.marker_item, state="normal")
+        self.canvas.tag_raise(self.sweep_item)
+        self.canvas.tag_raise(self.marker_item)